@@ -7,12 +7,11 @@ Helper interfaces specific to ``git add`` subcommand.
 
 from abc import abstractmethod
 from pathlib import Path
-from typing import Protocol, Unpack, override, Literal
+from typing import Protocol, Unpack, override, Literal, Final, NoReturn, Any, cast
 
 from gitbolt._internal_init import errmsg_creator
 from gitbolt.exceptions import GitExitingException
 from gitbolt.models import GitAddOpts
-from vt.utils.commons.commons.core_py import has_atleast_one_arg, ensure_atleast_one_arg
 from vt.utils.errors.error_specs import ERR_DATA_FORMAT_ERR, ERR_INVALID_USAGE
 from vt.utils.errors.error_specs.utils import require_type
 
@@ -216,6 +215,10 @@ class UtilAddArgsValidator(AddArgsValidator):
         >>> UtilAddArgsValidator().mandate_required_arguments(None, pathspec_from_file=None, pathspec_stdin=None)
         Traceback (most recent call last):
         gitbolt.exceptions.GitExitingException: ValueError: Either pathspec or pathspec_from_file is required
+        >>> UtilAddArgsValidator().mandate_required_arguments(None, None, # type: ignore[arg-type] # expected str provided None
+        ...                 pathspec_from_file=None, pathspec_stdin=None)
+        Traceback (most recent call last):
+        gitbolt.exceptions.GitExitingException: ValueError: Either pathspec or pathspec_from_file is required
 
         * ``pathspec_stdin`` not provided when ``pathspec_from_file=-``:
 
@@ -226,20 +229,17 @@ class UtilAddArgsValidator(AddArgsValidator):
         :raises GitExitingException: if no mandatory args are provided.
         """
         if (
-            not has_atleast_one_arg(pathspec, *pathspecs, enforce_type=False)
+            pathspec is None
+            and all(_pathspec is None for _pathspec in pathspecs)
             and pathspec_from_file is None
         ):
             errmsg = errmsg_creator.at_least_one_required(
                 "pathspec", "pathspec_from_file"
             )
-            raise GitExitingException(
-                errmsg, exit_code=ERR_INVALID_USAGE
-            ) from ValueError(errmsg)
+            _raise_invalid_usage(errmsg)
         if pathspec_from_file == "-" and pathspec_stdin is None:
             errmsg = "pathspec_stdin must be provided when pathspec_form_file is -"
-            raise GitExitingException(
-                errmsg, exit_code=ERR_INVALID_USAGE
-            ) from ValueError(errmsg)
+            _raise_invalid_usage(errmsg)
 
     def validate_exclusive_args(
         self,
@@ -276,6 +276,11 @@ class UtilAddArgsValidator(AddArgsValidator):
             Traceback (most recent call last):
             gitbolt.exceptions.GitExitingException: ValueError: pathspec and pathspec_from_file are not allowed together
 
+            >>> UtilAddArgsValidator().validate_exclusive_args("README.md", pathspec_from_file=None,
+            ...     pathspec_stdin="foo", pathspec_file_nul=True)
+            Traceback (most recent call last):
+            gitbolt.exceptions.GitExitingException: ValueError: pathspec and pathspec_stdin are not allowed together
+
             >>> UtilAddArgsValidator().validate(pathspec_from_file="file.txt")  # type: ignore[arg-type]
             Traceback (most recent call last):
             gitbolt.exceptions.GitExitingException: TypeError: 'pathspec_from_file' must be a pathlib.Path or the string literal '-'.
@@ -286,49 +291,36 @@ class UtilAddArgsValidator(AddArgsValidator):
 
         :raises GitExitingException: if exclusive args are provided together.
         """
-        if has_atleast_one_arg(pathspec, *pathspecs, enforce_type=False):
-            try:
-                ensure_atleast_one_arg(pathspec, *pathspecs, enforce_type=str)
-            except TypeError as te:
-                raise GitExitingException(
-                    "pathspec must be a string.", exit_code=ERR_DATA_FORMAT_ERR
-                ) from te
-
-            if pathspec_from_file is not None:
-                errmsg = errmsg_creator.not_allowed_together(
-                    "pathspec", "pathspec_from_file"
-                )
-                raise GitExitingException(
-                    errmsg, exit_code=ERR_INVALID_USAGE
-                ) from ValueError(errmsg)
-            if pathspec_stdin is not None:
-                errmsg = errmsg_creator.not_allowed_together(
-                    "pathspec", "pathspec_stdin"
-                )
-                raise GitExitingException(
-                    errmsg, exit_code=ERR_INVALID_USAGE
-                ) from ValueError(errmsg)
-            if pathspec_file_nul:
-                errmsg = errmsg_creator.not_allowed_together(
-                    "pathspec_file_nul", "pathspec"
-                )
-                raise GitExitingException(
-                    errmsg, exit_code=ERR_INVALID_USAGE
-                ) from ValueError(errmsg)
+        has_pathspec = False
+        for _pathspec in (pathspec, *pathspecs):
+            if _pathspec is not None:
+                has_pathspec = True
+                if not isinstance(_pathspec, str):
+                    errmsg = "pathspec must be a string."
+                    _raise_data_format(errmsg)
+
+        if has_pathspec and (
+            pathspec_from_file is not None
+            or pathspec_stdin is not None
+            or pathspec_file_nul
+        ):
+            for conflicting, errmsg in (
+                (pathspec_from_file is not None, _MSG_PATHSPEC_WITH_FROM_FILE),
+                (pathspec_stdin is not None, _MSG_PATHSPEC_WITH_STDIN),
+                (pathspec_file_nul, _MSG_FILE_NUL_WITH_PATHSPEC),
+            ):
+                if conflicting:
+                    _raise_invalid_usage(errmsg)
         if pathspec_from_file == "-" and pathspec_stdin is None:
             errmsg = errmsg_creator.all_required(
                 "pathspec_stdin",
                 "pathspec_from_file",
                 suffix=" when pathspec_from_file is '-'.",
             )
-            raise GitExitingException(
-                errmsg, exit_code=ERR_INVALID_USAGE
-            ) from ValueError(errmsg)
+            _raise_invalid_usage(errmsg)
         if pathspec_from_file != "-" and pathspec_stdin is not None:
             errmsg = "pathspec_stdin is not allowed unless pathspec_from_file is '-'."
-            raise GitExitingException(
-                errmsg, exit_code=ERR_INVALID_USAGE
-            ) from ValueError(errmsg)
+            _raise_invalid_usage(errmsg)
 
     # region validate_git_add_opts
     def validate_git_add_opts(self, **add_opts: Unpack[GitAddOpts]) -> None:
@@ -337,10 +329,13 @@ class UtilAddArgsValidator(AddArgsValidator):
         Delegates to specialized validation methods.
 
         >>> UtilAddArgsValidator().validate_git_add_opts(verbose=True, chmod='+x', no_all=False)
+        >>> UtilAddArgsValidator().validate_git_add_opts()
         >>> UtilAddArgsValidator().validate_git_add_opts(verbose='yes') # type: ignore[arg-type] # expected bool provided str
         Traceback (most recent call last):
         gitbolt.exceptions.GitExitingException: TypeError: 'verbose' must be a boolean
         """
+        if not add_opts:
+            return
         self.validate_bool_args(**add_opts)
         self.validate_tri_state_args(**add_opts)
         self.validate_chmod_arg(add_opts.get("chmod"))
@@ -354,31 +349,44 @@ class UtilAddArgsValidator(AddArgsValidator):
         >>> UtilAddArgsValidator().validate_bool_args(verbose='true') # type: ignore[arg-type] # expected bool provided str
         Traceback (most recent call last):
         gitbolt.exceptions.GitExitingException: TypeError: 'verbose' must be a boolean
+
+        Options are validated in the order they are passed in:
+
+        >>> UtilAddArgsValidator().validate_bool_args(force=1, verbose='true') # type: ignore[arg-type] # expected bool provided int, str
+        Traceback (most recent call last):
+        gitbolt.exceptions.GitExitingException: TypeError: 'force' must be a boolean
         """
-        if "verbose" in bool_add_opts:
-            self.validate_verbose_bool_arg(bool_add_opts["verbose"])
-        if "dry_run" in bool_add_opts:
-            self.validate_dry_run_bool_arg(bool_add_opts["dry_run"])
-        if "force" in bool_add_opts:
-            self.validate_force_bool_arg(bool_add_opts["force"])
-        if "interactive" in bool_add_opts:
-            self.validate_interactive_bool_arg(bool_add_opts["interactive"])
-        if "patch" in bool_add_opts:
-            self.validate_patch_bool_arg(bool_add_opts["patch"])
-        if "edit" in bool_add_opts:
-            self.validate_edit_bool_arg(bool_add_opts["edit"])
-        if "sparse" in bool_add_opts:
-            self.validate_sparse_bool_arg(bool_add_opts["sparse"])
-        if "intent_to_add" in bool_add_opts:
-            self.validate_intent_to_add_bool_arg(bool_add_opts["intent_to_add"])
-        if "refresh" in bool_add_opts:
-            self.validate_refresh_bool_arg(bool_add_opts["refresh"])
-        if "ignore_errors" in bool_add_opts:
-            self.validate_ignore_errors_bool_arg(bool_add_opts["ignore_errors"])
-        if "ignore_missing" in bool_add_opts:
-            self.validate_ignore_missing_bool_arg(bool_add_opts["ignore_missing"])
-        if "renormalize" in bool_add_opts:
-            self.validate_renormalize_bool_arg(bool_add_opts["renormalize"])
+        # values of a TypedDict's items() are typed object, each validator below checks its own.
+        opts = cast(dict[str, Any], bool_add_opts)
+        bool_keys = _ADD_BOOL_KEYS
+        for key, val in opts.items():
+            if key not in bool_keys:
+                continue
+            match key:
+                case "verbose":
+                    self.validate_verbose_bool_arg(val)
+                case "dry_run":
+                    self.validate_dry_run_bool_arg(val)
+                case "force":
+                    self.validate_force_bool_arg(val)
+                case "interactive":
+                    self.validate_interactive_bool_arg(val)
+                case "patch":
+                    self.validate_patch_bool_arg(val)
+                case "edit":
+                    self.validate_edit_bool_arg(val)
+                case "sparse":
+                    self.validate_sparse_bool_arg(val)
+                case "intent_to_add":
+                    self.validate_intent_to_add_bool_arg(val)
+                case "refresh":
+                    self.validate_refresh_bool_arg(val)
+                case "ignore_errors":
+                    self.validate_ignore_errors_bool_arg(val)
+                case "ignore_missing":
+                    self.validate_ignore_missing_bool_arg(val)
+                case "renormalize":
+                    self.validate_renormalize_bool_arg(val)
 
     def validate_verbose_bool_arg(self, verbose: bool) -> None:
         """Validate `verbose` argument.
@@ -514,12 +522,16 @@ class UtilAddArgsValidator(AddArgsValidator):
         ...
         gitbolt.exceptions.GitExitingException: TypeError: 'no_all' must be either True, False, or None
         """
-        if "no_all" in tri_state_add_opts:
-            self.validate_no_all_tri_state_arg(tri_state_add_opts["no_all"])
-        if "no_ignore_removal" in tri_state_add_opts:
-            self.validate_no_ignore_removal_tri_state_arg(
-                tri_state_add_opts["no_ignore_removal"]
-            )
+        opts = cast(dict[str, Any], tri_state_add_opts)
+        tri_state_keys = _ADD_TRI_STATE_KEYS
+        for key, val in opts.items():
+            if key not in tri_state_keys:
+                continue
+            match key:
+                case "no_all":
+                    self.validate_no_all_tri_state_arg(val)
+                case "no_ignore_removal":
+                    self.validate_no_ignore_removal_tri_state_arg(val)
 
     def validate_no_all_tri_state_arg(self, no_all: bool | None) -> None:
         """
@@ -530,12 +542,13 @@ class UtilAddArgsValidator(AddArgsValidator):
         >>> UtilAddArgsValidator().validate_no_all_tri_state_arg('bad') # type: ignore[arg-type] # expected [bool | None] provided str
         Traceback (most recent call last):
         gitbolt.exceptions.GitExitingException: TypeError: 'no_all' must be either True, False, or None
+        >>> UtilAddArgsValidator().validate_no_all_tri_state_arg(1) # type: ignore[arg-type] # expected [bool | None] provided int
+        Traceback (most recent call last):
+        gitbolt.exceptions.GitExitingException: TypeError: 'no_all' must be either True, False, or None
         """
-        if no_all not in (True, False, None):
+        if no_all is not None and type(no_all) is not bool:
             errmsg = "'no_all' must be either True, False, or None"
-            raise GitExitingException(
-                errmsg, exit_code=ERR_DATA_FORMAT_ERR
-            ) from TypeError(errmsg)
+            _raise_data_format(errmsg)
 
     def validate_no_ignore_removal_tri_state_arg(
         self, no_ignore_removal: bool | None
@@ -548,11 +561,9 @@ class UtilAddArgsValidator(AddArgsValidator):
         Traceback (most recent call last):
         gitbolt.exceptions.GitExitingException: TypeError: 'no_ignore_removal' must be either True, False, or None
         """
-        if no_ignore_removal not in (True, False, None):
+        if no_ignore_removal is not None and type(no_ignore_removal) is not bool:
             errmsg = "'no_ignore_removal' must be either True, False, or None"
-            raise GitExitingException(
-                errmsg, exit_code=ERR_DATA_FORMAT_ERR
-            ) from TypeError(errmsg)
+            _raise_data_format(errmsg)
 
     # endregion
 
@@ -562,18 +573,22 @@ class UtilAddArgsValidator(AddArgsValidator):
 
         >>> UtilAddArgsValidator().validate_chmod_arg('+x')
         >>> UtilAddArgsValidator().validate_chmod_arg(None)
+
+        ``str`` subclasses, like ``StrEnum`` members, are accepted:
+
+        >>> from enum import StrEnum
+        >>> class _Mode(StrEnum):
+        ...     EXEC = "+x"
+        >>> UtilAddArgsValidator().validate_chmod_arg(_Mode.EXEC) # type: ignore[arg-type] # expected Literal[+x, -x] provided _Mode
         >>> UtilAddArgsValidator().validate_chmod_arg('bad') # type: ignore[arg-type] # expected Literal[+x, -x] provided str
         Traceback (most recent call last):
         gitbolt.exceptions.GitExitingException: ValueError: Unexpected chmod value. Choose from '+x' and '-x'.
+        >>> UtilAddArgsValidator().validate_chmod_arg(['+x']) # type: ignore[arg-type] # expected Literal[+x, -x] provided list
+        Traceback (most recent call last):
+        gitbolt.exceptions.GitExitingException: ValueError: Unexpected chmod value. Choose from '+x' and '-x'.
         """
-        if chmod:
-            if chmod not in ("+x", "-x"):
-                errmsg = errmsg_creator.errmsg_for_choices(
-                    emphasis="chmod", choices=["+x", "-x"]
-                )
-                raise GitExitingException(
-                    errmsg, exit_code=ERR_INVALID_USAGE
-                ) from ValueError(errmsg)
+        if chmod and (not isinstance(chmod, str) or chmod not in _CHMOD_ALLOWED):
+            _raise_invalid_usage(_MSG_CHMOD_CHOICES)
 
     # endregion
 
@@ -617,6 +632,13 @@ class UtilAddArgsValidator(AddArgsValidator):
 
         >>> UtilAddArgsValidator().validate_pathspec_from_file(Path("foo.txt"))
         >>> UtilAddArgsValidator().validate_pathspec_from_file('-')
+        >>> UtilAddArgsValidator().validate_pathspec_from_file(None)
+
+        Concrete ``Path`` flavours, like ``PosixPath``, which ``Path()`` actually creates, are accepted:
+
+        >>> type(Path("foo.txt")) is Path
+        False
+        >>> UtilAddArgsValidator().validate_pathspec_from_file(type(Path())("foo.txt"))
         >>> UtilAddArgsValidator().validate_pathspec_from_file(123) # type: ignore[arg-type] # expected Path | Literal['-'] # provided int
         Traceback (most recent call last):
         gitbolt.exceptions.GitExitingException: TypeError: 'pathspec_from_file' must be a pathlib.Path or the string literal '-'.
@@ -624,16 +646,15 @@ class UtilAddArgsValidator(AddArgsValidator):
         Traceback (most recent call last):
         gitbolt.exceptions.GitExitingException: TypeError: 'pathspec_from_file' must be a pathlib.Path or the string literal '-'.
         """
-        if pathspec_from_file is not None:
-            if (
-                not isinstance(pathspec_from_file, (Path, str))
-                or pathspec_from_file != "-"
-                and not isinstance(pathspec_from_file, Path)
-            ):
-                errmsg = "'pathspec_from_file' must be a pathlib.Path or the string literal '-'."
-                raise GitExitingException(
-                    errmsg, exit_code=ERR_DATA_FORMAT_ERR
-                ) from TypeError(errmsg)
+        if (
+            pathspec_from_file is not None
+            and pathspec_from_file != "-"
+            and not isinstance(pathspec_from_file, Path)
+        ):
+            errmsg = (
+                "'pathspec_from_file' must be a pathlib.Path or the string literal '-'."
+            )
+            _raise_data_format(errmsg)
 
     def validate_pathspec_stdin(self, pathspec_stdin: str | None):
         """
@@ -650,3 +671,76 @@ class UtilAddArgsValidator(AddArgsValidator):
             require_type(pathspec_stdin, "pathspec_stdin", str, GitExitingException)
 
     # endregion
+
+
+_ADD_BOOL_KEYS: Final[frozenset[str]] = frozenset(
+    {
+        "verbose",
+        "dry_run",
+        "force",
+        "interactive",
+        "patch",
+        "edit",
+        "sparse",
+        "intent_to_add",
+        "refresh",
+        "ignore_errors",
+        "ignore_missing",
+        "renormalize",
+    }
+)
+"""
+``GitAddOpts`` keys that only take a ``bool``.
+"""
+
+_ADD_TRI_STATE_KEYS: Final[frozenset[str]] = frozenset({"no_all", "no_ignore_removal"})
+"""
+``GitAddOpts`` keys that take ``True``, ``False`` or ``None``.
+"""
+
+_CHMOD_ALLOWED: Final[frozenset[str]] = frozenset({"+x", "-x"})
+"""
+Values accepted for the ``chmod`` option.
+"""
+
+# error messages of the add validators, formed once at import rather than on every failed validation.
+_MSG_CHMOD_CHOICES: Final[str] = errmsg_creator.errmsg_for_choices(
+    emphasis="chmod", choices=["+x", "-x"]
+)
+_MSG_PATHSPEC_WITH_FROM_FILE: Final[str] = errmsg_creator.not_allowed_together(
+    "pathspec", "pathspec_from_file"
+)
+_MSG_PATHSPEC_WITH_STDIN: Final[str] = errmsg_creator.not_allowed_together(
+    "pathspec", "pathspec_stdin"
+)
+_MSG_FILE_NUL_WITH_PATHSPEC: Final[str] = errmsg_creator.not_allowed_together(
+    "pathspec_file_nul", "pathspec"
+)
+
+
+def _raise_invalid_usage(errmsg: str) -> NoReturn:
+    """
+    >>> _raise_invalid_usage("bad usage")
+    Traceback (most recent call last):
+    gitbolt.exceptions.GitExitingException: ValueError: bad usage
+
+    :param errmsg: the error message.
+    :raises GitExitingException: with ``ERR_INVALID_USAGE`` exit code, caused by a ``ValueError``.
+    """
+    raise GitExitingException(errmsg, exit_code=ERR_INVALID_USAGE) from ValueError(
+        errmsg
+    )
+
+
+def _raise_data_format(errmsg: str) -> NoReturn:
+    """
+    >>> _raise_data_format("bad type")
+    Traceback (most recent call last):
+    gitbolt.exceptions.GitExitingException: TypeError: bad type
+
+    :param errmsg: the error message.
+    :raises GitExitingException: with ``ERR_DATA_FORMAT_ERR`` exit code, caused by a ``TypeError``.
+    """
+    raise GitExitingException(errmsg, exit_code=ERR_DATA_FORMAT_ERR) from TypeError(
+        errmsg
+    )
@@ -6,8 +6,9 @@ Helper interfaces for ``git add`` subcommand with default implementation for sub
 """
 
 from abc import abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Protocol, Unpack, override, Literal
+from typing import Any, ClassVar, Protocol, Unpack, override, Literal, Final
 
 from gitbolt.git_subprocess.constants import ADD_CMD
 from gitbolt.models import GitAddOpts
@@ -70,8 +71,23 @@ class IndividuallyOverridableACAB(AddCLIArgsBuilder):
 
     Build CLI args to run ``git add`` subcommand in a subprocess. This class is independent in its working and
     provides interface to individually override each arg former for fine-grained control.
+
+    Subclasses overriding none of the arg formers are built straight from the flag tables, just like this class.
     """
 
+    _overridden_arg_formers: ClassVar[frozenset[str]] = frozenset()
+    """
+    Names of the arg formers overridden by this class. Empty for this class itself.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._overridden_arg_formers = frozenset(
+            name
+            for name in _ADD_ARG_FORMERS
+            if getattr(cls, name) is not getattr(IndividuallyOverridableACAB, name)
+        )
+
     @override
     def build(
         self,
@@ -139,7 +155,32 @@ class IndividuallyOverridableACAB(AddCLIArgsBuilder):
         ...               intent_to_add=True, refresh=True, ignore_errors=True, ignore_missing=True,
         ...               renormalize=True, chmod='-x')
         ['add', '--verbose', '--dry-run', '--force', '--interactive', '--patch', '--edit', '--all', '--no-ignore-removal', '--sparse', '--intent-to-add', '--refresh', '--ignore-errors', '--ignore-missing', '--renormalize', '--chmod=-x', 'src/file.py']
-        """
+
+        Subclasses produce the same args unless they override any arg formers, in which case the args are formed
+        by the arg formers:
+
+        >>> class _Sub(IndividuallyOverridableACAB):
+        ...     pass
+        >>> _Sub._overridden_arg_formers
+        frozenset()
+        >>> _opts = dict(verbose=True, no_all=False, no_ignore_removal=True, refresh=True, chmod='+x')
+        >>> _Sub().build("a", None, "b", pathspec_file_nul=True, **_opts) == builder.build(
+        ...     "a", None, "b", pathspec_file_nul=True, **_opts)
+        True
+        >>> class _ShortVerbose(IndividuallyOverridableACAB):
+        ...     def verbose_arg(self, verbose):
+        ...         return ["-v"] if verbose else []
+        >>> sorted(_ShortVerbose._overridden_arg_formers)
+        ['verbose_arg']
+        >>> _ShortVerbose().build("a", "b", **_opts)
+        ['add', '-v', '--all', '--no-ignore-removal', '--refresh', '--chmod=+x', 'a', 'b']
+        """
+        if not self._overridden_arg_formers:
+            # none of the arg formers are overridden, so build directly from the flag tables.
+            return _build_add_args(
+                pathspec, pathspecs, pathspec_from_file, pathspec_file_nul, add_opts
+            )
+
         sub_cmd_args = [ADD_CMD]
 
         # region GitAddOpts members
@@ -392,7 +433,7 @@ class IndividuallyOverridableACAB(AddCLIArgsBuilder):
         """
         if chmod is None:
             return []
-        return [f"--chmod={chmod}"]
+        return [_chmod_flag(chmod)]
 
     def tree_ish_arg(self, tree_ish: str) -> list[str]:
         """
@@ -455,7 +496,7 @@ class IndividuallyOverridableACAB(AddCLIArgsBuilder):
         """
         if pathspec_from_file is None:
             return []
-        return [f"--pathspec-from-file={str(pathspec_from_file)}"]
+        return [f"--pathspec-from-file={pathspec_from_file}"]
 
     def pathspec_arg(self, *pathspecs: str | None) -> list[str]:
         """
@@ -482,3 +523,128 @@ class IndividuallyOverridableACAB(AddCLIArgsBuilder):
         :return: pathspecs in a list if supplied.
         """
         return [pathspec for pathspec in pathspecs if pathspec is not None]
+
+
+_ADD_LEADING_BOOL_FLAGS: Final[tuple[tuple[str, str], ...]] = (
+    ("verbose", "--verbose"),
+    ("dry_run", "--dry-run"),
+    ("force", "--force"),
+    ("interactive", "--interactive"),
+    ("patch", "--patch"),
+    ("edit", "--edit"),
+)
+"""
+``GitAddOpts`` bool keys and their flags, emitted before the tri-state flags.
+"""
+
+_ADD_TRI_STATE_FLAGS: Final[tuple[tuple[str, str, str], ...]] = (
+    ("no_all", "--no-all", "--all"),
+    ("no_ignore_removal", "--no-ignore-removal", "--ignore-removal"),
+)
+"""
+``GitAddOpts`` tri-state keys with their flags for ``True`` and ``False``. ``None`` emits no flag.
+"""
+
+_ADD_TRAILING_BOOL_FLAGS: Final[tuple[tuple[str, str], ...]] = (
+    ("sparse", "--sparse"),
+    ("intent_to_add", "--intent-to-add"),
+    ("refresh", "--refresh"),
+    ("ignore_errors", "--ignore-errors"),
+    ("ignore_missing", "--ignore-missing"),
+    ("renormalize", "--renormalize"),
+)
+"""
+``GitAddOpts`` bool keys and their flags, emitted after the tri-state flags.
+"""
+
+_ADD_ARG_FORMERS: Final[tuple[str, ...]] = (
+    *(f"{key}_arg" for key, _ in _ADD_LEADING_BOOL_FLAGS),
+    "no_all",
+    "no_ignore_removal_arg",
+    *(f"{key}_arg" for key, _ in _ADD_TRAILING_BOOL_FLAGS),
+    "chmod_arg",
+    "pathspec_file_nul_arg",
+    "pathspec_from_file_arg",
+    "pathspec_arg",
+)
+"""
+The individually overridable arg formers of ``IndividuallyOverridableACAB`` that ``build()`` goes through.
+"""
+
+
+def _build_add_args(
+    pathspec: str | None,
+    pathspecs: tuple[str | None, ...],
+    pathspec_from_file: Path | Literal["-"] | None,
+    pathspec_file_nul: bool,
+    add_opts: GitAddOpts,
+) -> list[str]:
+    """
+    Flag table driven equivalent of ``IndividuallyOverridableACAB.build()``, used when none of its arg formers are
+    overridden.
+
+    The flag tables cover every ``GitAddOpts`` key other than ``chmod``:
+
+    >>> _table_keys = [k for k, *_ in _ADD_LEADING_BOOL_FLAGS + _ADD_TRI_STATE_FLAGS + _ADD_TRAILING_BOOL_FLAGS]
+    >>> sorted(_table_keys + ["chmod"]) == sorted(GitAddOpts.__annotations__)
+    True
+    >>> all(callable(getattr(IndividuallyOverridableACAB, name)) for name in _ADD_ARG_FORMERS)
+    True
+
+    >>> _build_add_args("a", ("b",), None, False, {"dry_run": True, "no_all": True, "chmod": "+x"})
+    ['add', '--dry-run', '--no-all', '--chmod=+x', 'a', 'b']
+    """
+    sub_cmd_args = [ADD_CMD]
+    append = sub_cmd_args.append
+    get = add_opts.get
+
+    for key, flag in _ADD_LEADING_BOOL_FLAGS:
+        if get(key):
+            append(flag)
+    for key, true_flag, false_flag in _ADD_TRI_STATE_FLAGS:
+        val = get(key)
+        if val is not None:
+            append(true_flag if val else false_flag)
+    for key, flag in _ADD_TRAILING_BOOL_FLAGS:
+        if get(key):
+            append(flag)
+    chmod = get("chmod")
+    if chmod is not None:
+        append(_chmod_flag(chmod))
+
+    if pathspec_file_nul:
+        append("--pathspec-file-nul")
+    if pathspec_from_file is not None:
+        append(f"--pathspec-from-file={pathspec_from_file}")
+    if pathspec is not None:
+        append(pathspec)
+    sub_cmd_args.extend(p for p in pathspecs if p is not None)
+    return sub_cmd_args
+
+
+def _chmod_flag(chmod: object) -> str:
+    """
+    ``--chmod=(+|-)x`` flag. Plain ``str`` values are formatted once per value as ``chmod`` only takes ``+x`` or
+    ``-x``. Anything else, like a ``chmod`` that skipped validation, is formatted afresh as builders do not validate.
+
+    >>> _chmod_flag("+x")
+    '--chmod=+x'
+    >>> _chmod_flag("-x") is _chmod_flag("-x")
+    True
+    >>> _chmod_flag(["+x"])
+    "--chmod=['+x']"
+    """
+    if type(chmod) is str:
+        return _cached_chmod_flag(chmod)
+    return f"--chmod={chmod}"
+
+
+@lru_cache(maxsize=8)
+def _cached_chmod_flag(chmod: str) -> str:
+    """
+    ``--chmod=(+|-)x`` flag, cached per ``chmod`` value.
+
+    >>> _cached_chmod_flag("+x")
+    '--chmod=+x'
+    """
+    return f"--chmod={chmod}"
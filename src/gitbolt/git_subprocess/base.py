@@ -8,12 +8,24 @@ Git command interfaces with default implementation using subprocess calls.
 from __future__ import annotations
 
 from abc import abstractmethod, ABC
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from io import StringIO
 from pathlib import Path
-from subprocess import CompletedProcess
-from typing import override, Protocol, Unpack, Self, overload, Literal, Any
+from subprocess import CompletedProcess, CalledProcessError, PIPE
+from tempfile import TemporaryFile
+from typing import (
+    override,
+    Protocol,
+    Unpack,
+    Self,
+    overload,
+    Literal,
+    Any,
+    cast,
+    IO,
+)
 
-from vt.utils.commons.commons.core_py import is_unset, not_none_not_unset
+from vt.utils.commons.commons.core_py import not_none_not_unset
 from vt.utils.commons.commons.op import RootDirOp
 from vt.utils.errors.error_specs import ERR_INVALID_USAGE
 
@@ -24,7 +36,17 @@ from gitbolt.git_subprocess.ls_tree import (
     LsTreeCLIArgsBuilder,
     IndividuallyOverridableLTCAB,
 )
-from gitbolt.git_subprocess.runner import GitCommandRunner
+from gitbolt.git_subprocess.runner import GitCommandRunner, AsyncGitCommandRunner
+from gitbolt.git_subprocess.runner.simple_impl import SimpleAsyncGitCR
+from gitbolt.git_subprocess.constants import VERSION_CMD
+from gitbolt.git_subprocess.exceptions import GitCmdException
+from gitbolt.git_subprocess.utils import (
+    iter_records,
+    git_main_cmd_repeating_flag_args,
+    git_main_cmd_dict_flag_args,
+    git_main_cmd_simple_flag_args,
+    git_main_cmd_pair_flag_args,
+)
 from gitbolt.models import GitOpts, GitLsTreeOpts, GitAddOpts, GitEnvVars
 from gitbolt.utils import merge_git_opts, merge_git_envs
 
@@ -34,11 +56,18 @@ class GitCommand(Git, ABC):
     Runs git as a command.
     """
 
-    def __init__(self, runner: GitCommandRunner):
+    def __init__(
+        self,
+        runner: GitCommandRunner,
+        async_runner: AsyncGitCommandRunner | None = None,
+    ):
         """
         :param runner: a ``GitCommandRunner`` which eventually runs the cli command in a subprocess.
+        :param async_runner: an ``AsyncGitCommandRunner`` which runs the cli command in an ``asyncio`` subprocess
+            for the ``a``-prefixed async twins of subcommands. Defaults to ``SimpleAsyncGitCR``.
         """
         self.runner: GitCommandRunner = runner
+        self.async_runner: AsyncGitCommandRunner = async_runner or SimpleAsyncGitCR()
         self._main_cmd_opts: GitOpts = {}
         self._env_vars: GitEnvVars | None = None
 
@@ -82,136 +111,98 @@ class GitCommand(Git, ABC):
         return _git_cmd
 
     def _main_cmd_cap_c_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("C")
-        if not_none_not_unset(val):
-            return [item for path in val for item in ["-C", str(path)]]
-        return []
+        return git_main_cmd_repeating_flag_args(self._main_cmd_opts.get("C"), "-C")
 
     def _main_cmd_small_c_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("c")
-        if not_none_not_unset(val):
-            args = []
-            for k, v in val.items():
-                if is_unset(v):
-                    continue  # explicitly skip unset keys
-                if v is True or v is None:  # treat None as True
-                    args += ["-c", k]
-                elif v is False:
-                    args += ["-c", f"{k}="]
-                else:
-                    args += ["-c", f"{k}={v}"]
-            return args
-        return []
+        return git_main_cmd_dict_flag_args(self._main_cmd_opts.get("c"), "-c")
 
     def _main_cmd_config_env_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("config_env")
-        if not_none_not_unset(val):
-            return [
-                item for k, v in val.items() for item in ["--config-env", f"{k}={v}"]
-            ]
-        return []
+        return git_main_cmd_dict_flag_args(
+            self._main_cmd_opts.get("config_env"), "--config-env"
+        )
 
     def _main_cmd_exec_path_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("exec_path")
-        if not_none_not_unset(val):
-            return ["--exec-path", str(val)]
-        return []
+        return git_main_cmd_pair_flag_args(
+            self._main_cmd_opts.get("exec_path"), "--exec-path"
+        )
 
     def _main_cmd_paginate_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("paginate")
-        if not_none_not_unset(val):
-            return ["--paginate"]
-        return []
+        return git_main_cmd_simple_flag_args(
+            self._main_cmd_opts.get("paginate"), "--paginate"
+        )
 
     def _main_cmd_no_pager_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("no_pager")
-        if not_none_not_unset(val):
-            return ["--no-pager"]
-        return []
+        return git_main_cmd_simple_flag_args(
+            self._main_cmd_opts.get("no_pager"), "--no-pager"
+        )
 
     def _main_cmd_git_dir_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("git_dir")
-        if not_none_not_unset(val):
-            return ["--git-dir", str(val)]
-        return []
+        return git_main_cmd_pair_flag_args(
+            self._main_cmd_opts.get("git_dir"), "--git-dir"
+        )
 
     def _main_cmd_work_tree_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("work_tree")
-        if not_none_not_unset(val):
-            return ["--work-tree", str(val)]
-        return []
+        return git_main_cmd_pair_flag_args(
+            self._main_cmd_opts.get("work_tree"), "--work-tree"
+        )
 
     def _main_cmd_namespace_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("namespace")
-        if not_none_not_unset(val):
-            return ["--namespace", val]
-        return []
+        return git_main_cmd_pair_flag_args(
+            self._main_cmd_opts.get("namespace"), "--namespace"
+        )
 
     def _main_cmd_bare_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("bare")
-        if not_none_not_unset(val):
-            return ["--bare"]
-        return []
+        return git_main_cmd_simple_flag_args(self._main_cmd_opts.get("bare"), "--bare")
 
     def _main_cmd_no_replace_objects_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("no_replace_objects")
-        if not_none_not_unset(val):
-            return ["--no-replace-objects"]
-        return []
+        return git_main_cmd_simple_flag_args(
+            self._main_cmd_opts.get("no_replace_objects"), "--no-replace-objects"
+        )
 
     def _main_cmd_no_lazy_fetch_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("no_lazy_fetch")
-        if not_none_not_unset(val):
-            return ["--no-lazy-fetch"]
-        return []
+        return git_main_cmd_simple_flag_args(
+            self._main_cmd_opts.get("no_lazy_fetch"), "--no-lazy-fetch"
+        )
 
     def _main_cmd_no_optional_locks_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("no_optional_locks")
-        if not_none_not_unset(val):
-            return ["--no-optional-locks"]
-        return []
+        return git_main_cmd_simple_flag_args(
+            self._main_cmd_opts.get("no_optional_locks"), "--no-optional-locks"
+        )
 
     def _main_cmd_no_advice_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("no_advice")
-        if not_none_not_unset(val):
-            return ["--no-advice"]
-        return []
+        return git_main_cmd_simple_flag_args(
+            self._main_cmd_opts.get("no_advice"), "--no-advice"
+        )
 
     def _main_cmd_literal_pathspecs_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("literal_pathspecs")
-        if not_none_not_unset(val):
-            return ["--literal-pathspecs"]
-        return []
+        return git_main_cmd_simple_flag_args(
+            self._main_cmd_opts.get("literal_pathspecs"), "--literal-pathspecs"
+        )
 
     def _main_cmd_glob_pathspecs_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("glob_pathspecs")
-        if not_none_not_unset(val):
-            return ["--glob-pathspecs"]
-        return []
+        return git_main_cmd_simple_flag_args(
+            self._main_cmd_opts.get("glob_pathspecs"), "--glob-pathspecs"
+        )
 
     def _main_cmd_noglob_pathspecs_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("noglob_pathspecs")
-        if not_none_not_unset(val):
-            return ["--noglob-pathspecs"]
-        return []
+        return git_main_cmd_simple_flag_args(
+            self._main_cmd_opts.get("noglob_pathspecs"), "--noglob-pathspecs"
+        )
 
     def _main_cmd_icase_pathspecs_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("icase_pathspecs")
-        if not_none_not_unset(val):
-            return ["--icase-pathspecs"]
-        return []
+        return git_main_cmd_simple_flag_args(
+            self._main_cmd_opts.get("icase_pathspecs"), "--icase-pathspecs"
+        )
 
     def _main_cmd_list_cmds_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("list_cmds")
-        if not_none_not_unset(val):
-            return [item for cmd in val for item in ["--list-cmds", cmd]]
-        return []
+        return git_main_cmd_repeating_flag_args(
+            self._main_cmd_opts.get("list_cmds"), "--list-cmds"
+        )
 
     def _main_cmd_attr_source_args(self) -> list[str]:
-        val = self._main_cmd_opts.get("attr_source")
-        if not_none_not_unset(val):
-            return ["--attr-source", val]
-        return []
+        return git_main_cmd_pair_flag_args(
+            self._main_cmd_opts.get("attr_source"), "--attr-source"
+        )
 
     # endregion
 
@@ -390,6 +381,54 @@ class VersionCommand(Version, GitSubcmdCommand, Protocol):
                     self._cache.build_options[b_k] = b_v
             return self._cache.build_options
 
+    @overload
+    async def aversion(self) -> Version.VersionInfo: ...
+
+    @overload
+    async def aversion(
+        self, build_options: Literal[True]
+    ) -> Version.VersionWithBuildInfo: ...
+
+    async def aversion(
+        self, build_options: Literal[True, False] = False
+    ) -> Version.VersionInfo | Version.VersionWithBuildInfo:
+        """
+        Async twin of ``version()``. Runs ``git version`` eagerly using the ``async_runner`` of the underlying git.
+
+        :param build_options: also query the build options of git.
+        :return: the version info of git.
+        """
+        sub_cmd_args = self._version_sub_cmd_args(build_options)
+        git = self.underlying_git
+        main_cmd_args = git.build_main_cmd_args()
+        env_vars = git.build_git_envs()
+
+        result = await git.async_runner.arun_git_command(
+            main_cmd_args,
+            sub_cmd_args,
+            check=True,
+            text=True,
+            capture_output=True,
+            env=env_vars,
+        )
+        rosetta = result.stdout.strip()
+
+        if build_options:
+            return VersionCommand.VersionWithBuildInfoForCmd(lambda: rosetta)
+        return VersionCommand.VersionInfoForCmd(lambda: rosetta)
+
+    def _version_sub_cmd_args(self, build_options: Literal[True, False]) -> list[str]:
+        """
+        Validate the ``version`` arguments and build the subcommand CLI args from them.
+
+        Shared by ``version()`` and ``aversion()``.
+        """
+        self._require_valid_args(build_options)
+        sub_cmd_args = [VERSION_CMD]
+        if build_options:
+            sub_cmd_args.append("--build-options")
+        return sub_cmd_args
+
 
 class LsTreeCommand(LsTree, GitSubcmdCommand, Protocol):
     """
@@ -401,13 +440,13 @@ class LsTreeCommand(LsTree, GitSubcmdCommand, Protocol):
 
     @override
     def ls_tree(self, tree_ish: str, **ls_tree_opts: Unpack[GitLsTreeOpts]) -> str:
-        self.args_validator.validate(tree_ish, **ls_tree_opts)
-        sub_cmd_args = self.cli_args_builder.build(tree_ish, **ls_tree_opts)
-        main_cmd_args = self.underlying_git.build_main_cmd_args()
-        env_vars = self.underlying_git.build_git_envs()
+        sub_cmd_args = self._ls_tree_sub_cmd_args(tree_ish, **ls_tree_opts)
+        git = self.underlying_git
+        main_cmd_args = git.build_main_cmd_args()
+        env_vars = git.build_git_envs()
 
         # Run the git command
-        result = self.underlying_git.runner.run_git_command(
+        result = git.runner.run_git_command(
             main_cmd_args,
             sub_cmd_args,
             check=True,
@@ -417,7 +456,65 @@ class LsTreeCommand(LsTree, GitSubcmdCommand, Protocol):
             env=env_vars,
         )
 
-        return result.stdout.strip()
+        return result.stdout.rstrip("\n")
+
+    async def als_tree(
+        self, tree_ish: str, **ls_tree_opts: Unpack[GitLsTreeOpts]
+    ) -> str:
+        """
+        Async twin of ``ls_tree()``. Runs ``git ls-tree`` using the ``async_runner`` of the underlying git.
+        """
+        sub_cmd_args = self._ls_tree_sub_cmd_args(tree_ish, **ls_tree_opts)
+        git = self.underlying_git
+        main_cmd_args = git.build_main_cmd_args()
+        env_vars = git.build_git_envs()
+
+        result = await git.async_runner.arun_git_command(
+            main_cmd_args,
+            sub_cmd_args,
+            check=True,
+            text=True,
+            capture_output=True,
+            cwd=self.root_dir,
+            env=env_vars,
+        )
+
+        return result.stdout.rstrip("\n")
+
+    def ls_tree_iter(
+        self, tree_ish: str, **ls_tree_opts: Unpack[GitLsTreeOpts]
+    ) -> Iterator[str]:
+        """
+        Streaming twin of ``ls_tree()``. Yields the ``git ls-tree`` output one entry at a time, as git produces it,
+        rather than buffering the whole output. Entries are split on NUL when ``z=True`` and on newlines otherwise.
+
+        Arguments are validated eagerly, but git is only started once the first entry is requested. Runners that
+        cannot stream, i.e. do not implement ``popen_git_command()``, get the whole output buffered by
+        ``run_git_command()`` instead.
+
+        :raises GitCmdException: once the output is exhausted, if git exited with a non-zero code.
+        """
+        sub_cmd_args = self._ls_tree_sub_cmd_args(tree_ish, **ls_tree_opts)
+        git = self.underlying_git
+        return _iter_git_records(
+            git.runner,
+            git.build_main_cmd_args(),
+            sub_cmd_args,
+            "\0" if ls_tree_opts.get("z") else "\n",
+            cwd=self.root_dir,
+            env=git.build_git_envs(),
+        )
+
+    def _ls_tree_sub_cmd_args(
+        self, tree_ish: str, **ls_tree_opts: Unpack[GitLsTreeOpts]
+    ) -> list[str]:
+        """
+        Validate the ``ls-tree`` arguments and build the subcommand CLI args from them.
+
+        Shared by ``ls_tree()`` and ``als_tree()``.
+        """
+        self.args_validator.validate(tree_ish, **ls_tree_opts)
+        return self.cli_args_builder.build(tree_ish, **ls_tree_opts)
 
     @property
     def cli_args_builder(self) -> LsTreeCLIArgsBuilder:
@@ -470,7 +567,7 @@ class AddCommand(Add, GitSubcmdCommand, Protocol):
         pathspec_file_nul: bool = False,
         **add_opts: Unpack[GitAddOpts],
     ) -> str:
-        self.args_validator.validate(
+        sub_cmd_args = self._add_sub_cmd_args(
             pathspec,
             *pathspecs,
             pathspec_from_file=pathspec_from_file,
@@ -478,18 +575,73 @@ class AddCommand(Add, GitSubcmdCommand, Protocol):
             pathspec_file_nul=pathspec_file_nul,
             **add_opts,
         )
-        sub_cmd_args = self.cli_args_builder.build(
+        git = self.underlying_git
+        main_cmd_args = git.build_main_cmd_args()
+        env_vars = git.build_git_envs()
+
+        # Run the git command
+        result = git.runner.run_git_command(
+            main_cmd_args,
+            sub_cmd_args,
+            _input=pathspec_stdin,
+            check=True,
+            text=True,
+            capture_output=True,
+            cwd=self.root_dir,
+            env=env_vars,
+        )
+
+        return result.stdout.strip()
+
+    @overload
+    async def aadd(
+        self, pathspec: str, *pathspecs: str, **add_opts: Unpack[GitAddOpts]
+    ) -> str: ...
+
+    @overload
+    async def aadd(
+        self,
+        *,
+        pathspec_from_file: Path,
+        pathspec_file_nul: bool = False,
+        **add_opts: Unpack[GitAddOpts],
+    ) -> str: ...
+
+    @overload
+    async def aadd(
+        self,
+        *,
+        pathspec_from_file: Literal["-"],
+        pathspec_stdin: str,
+        pathspec_file_nul: bool = False,
+        **add_opts: Unpack[GitAddOpts],
+    ) -> str: ...
+
+    async def aadd(
+        self,
+        pathspec: str | None = None,
+        *pathspecs: str,
+        pathspec_from_file: Path | Literal["-"] | None = None,
+        pathspec_stdin: str | None = None,
+        pathspec_file_nul: bool = False,
+        **add_opts: Unpack[GitAddOpts],
+    ) -> str:
+        """
+        Async twin of ``add()``. Runs ``git add`` using the ``async_runner`` of the underlying git.
+        """
+        sub_cmd_args = self._add_sub_cmd_args(
             pathspec,
             *pathspecs,
             pathspec_from_file=pathspec_from_file,
+            pathspec_stdin=pathspec_stdin,
             pathspec_file_nul=pathspec_file_nul,
             **add_opts,
         )
-        main_cmd_args = self.underlying_git.build_main_cmd_args()
-        env_vars = self.underlying_git.build_git_envs()
+        git = self.underlying_git
+        main_cmd_args = git.build_main_cmd_args()
+        env_vars = git.build_git_envs()
 
-        # Run the git command
-        result = self.underlying_git.runner.run_git_command(
+        result = await git.async_runner.arun_git_command(
             main_cmd_args,
             sub_cmd_args,
             _input=pathspec_stdin,
@@ -502,6 +654,36 @@ class AddCommand(Add, GitSubcmdCommand, Protocol):
 
         return result.stdout.strip()
 
+    def _add_sub_cmd_args(
+        self,
+        pathspec: str | None = None,
+        *pathspecs: str,
+        pathspec_from_file: Path | Literal["-"] | None = None,
+        pathspec_stdin: str | None = None,
+        pathspec_file_nul: bool = False,
+        **add_opts: Unpack[GitAddOpts],
+    ) -> list[str]:
+        """
+        Validate the ``add`` arguments and build the subcommand CLI args from them.
+
+        Shared by ``add()`` and ``aadd()``.
+        """
+        self.args_validator.validate(
+            pathspec,
+            *pathspecs,
+            pathspec_from_file=pathspec_from_file,
+            pathspec_stdin=pathspec_stdin,
+            pathspec_file_nul=pathspec_file_nul,
+            **add_opts,
+        )
+        return self.cli_args_builder.build(
+            pathspec,
+            *pathspecs,
+            pathspec_from_file=pathspec_from_file,
+            pathspec_file_nul=pathspec_file_nul,
+            **add_opts,
+        )
+
     @property
     def cli_args_builder(self) -> AddCLIArgsBuilder:
         """
@@ -584,8 +766,9 @@ class UncheckedSubcmd(GitSubcmdCommand, RootDirOp, Protocol):
 
         :return: ``CompletedProcess`` capturing all the required stdout, stderr, return-code etc.
         """
-        main_cmd_args = self.underlying_git.build_main_cmd_args()
-        envs_vars = self.underlying_git.build_git_envs()
+        git = self.underlying_git
+        main_cmd_args = git.build_main_cmd_args()
+        envs_vars = git.build_git_envs()
         another_supplied_env = subprocess_run_kwargs.pop("env", None)
         if another_supplied_env:
             if envs_vars is not None:
@@ -594,7 +777,7 @@ class UncheckedSubcmd(GitSubcmdCommand, RootDirOp, Protocol):
         capture_output = subprocess_run_kwargs.pop("capture_output", True)
         check = subprocess_run_kwargs.pop("check", True)
         # Run the git command
-        result = self.underlying_git.runner.run_git_command(
+        result = git.runner.run_git_command(
             main_cmd_args,
             subcommand_args,
             *subprocess_run_args,
@@ -607,3 +790,54 @@ class UncheckedSubcmd(GitSubcmdCommand, RootDirOp, Protocol):
             **subprocess_run_kwargs,
         )
         return result
+
+
+def _iter_git_records(
+    runner: GitCommandRunner,
+    main_cmd_args: list[str],
+    subcommand_args: list[str],
+    separator: str,
+    **popen_kwargs: Any,
+) -> Iterator[str]:
+    """
+    Run a git command using ``runner`` and yield the ``separator`` separated records from its stdout.
+
+    Being a generator, git is only started once the first record is requested, so an iterator dropped unconsumed
+    leaves no process behind. The process is reaped once the records are exhausted or the iterator is closed.
+
+    :param popen_kwargs: keyword arguments for ``popen_git_command()``, or ``run_git_command()`` if the ``runner``
+        cannot stream.
+    :raises GitCmdException: if git exited with a non-zero code.
+    """
+    # stderr goes to a file, a pipe left unread while stdout is read would block git once it is full.
+    with TemporaryFile("w+") as stderr_file:
+        try:
+            proc = runner.popen_git_command(
+                main_cmd_args,
+                subcommand_args,
+                text=True,
+                stdout=PIPE,
+                stderr=stderr_file,
+                **popen_kwargs,
+            )
+        except NotImplementedError:
+            result = runner.run_git_command(
+                main_cmd_args,
+                subcommand_args,
+                check=True,
+                text=True,
+                capture_output=True,
+                **popen_kwargs,
+            )
+            yield from iter_records(StringIO(result.stdout), separator)
+            return
+        with proc:
+            yield from iter_records(cast(IO[str], proc.stdout), separator)
+            returncode = proc.wait()
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+    if returncode:
+        e = CalledProcessError(returncode, proc.args, stderr=stderr)
+        raise GitCmdException(
+            stderr, called_process_error=e, exit_code=returncode
+        ) from e
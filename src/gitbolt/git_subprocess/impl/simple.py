@@ -24,9 +24,8 @@ from gitbolt.git_subprocess import (
     UncheckedSubcmd,
 )
 from gitbolt.git_subprocess.add import AddCLIArgsBuilder
-from gitbolt.git_subprocess.constants import VERSION_CMD
 from gitbolt.git_subprocess.ls_tree import LsTreeCLIArgsBuilder
-from gitbolt.git_subprocess.runner import GitCommandRunner
+from gitbolt.git_subprocess.runner import GitCommandRunner, AsyncGitCommandRunner
 from gitbolt.git_subprocess.runner.simple_impl import SimpleGitCR
 from gitbolt.ls_tree import LsTreeArgsValidator
 
@@ -54,15 +53,13 @@ class VersionCommandImpl(VersionCommand, GitSubcmdCommandImpl):
     def version(
         self, build_options: Literal[True, False] = False
     ) -> Version.VersionInfo | Version.VersionWithBuildInfo:
-        self._require_valid_args(build_options)
-        main_cmd_args = self.underlying_git.build_main_cmd_args()
-        sub_cmd_args = [VERSION_CMD]
-        env_vars = self.underlying_git.build_git_envs()
-        if build_options:
-            sub_cmd_args.append("--build-options")
+        sub_cmd_args = self._version_sub_cmd_args(build_options)
+        git = self.underlying_git
+        main_cmd_args = git.build_main_cmd_args()
+        env_vars = git.build_git_envs()
 
         def rosetta_supplier():
-            return self.underlying_git.runner.run_git_command(
+            return git.runner.run_git_command(
                 main_cmd_args,
                 sub_cmd_args,
                 check=True,
@@ -117,7 +114,12 @@ class LsTreeCommandImpl(LsTreeCommand, GitSubcmdCommandImpl):
         return self._cli_args_builder
 
     def clone(self) -> "LsTreeCommandImpl":
-        return LsTreeCommandImpl(self.root_dir, self.underlying_git)
+        return LsTreeCommandImpl(
+            self.root_dir,
+            self.underlying_git,
+            args_validator=self.args_validator,
+            cli_args_builder=self.cli_args_builder,
+        )
 
 
 class AddCommandImpl(AddCommand, GitSubcmdCommandImpl):
@@ -150,7 +152,12 @@ class AddCommandImpl(AddCommand, GitSubcmdCommandImpl):
         return self._cli_args_builder
 
     def clone(self) -> "AddCommandImpl":
-        return AddCommandImpl(self.root_dir, self.underlying_git)
+        return AddCommandImpl(
+            self.root_dir,
+            self.underlying_git,
+            args_validator=self.args_validator,
+            cli_args_builder=self.cli_args_builder,
+        )
 
 
 class UncheckedSubcmdImpl(UncheckedSubcmd, GitSubcmdCommandImpl):
@@ -173,12 +180,13 @@ class SimpleGitCommand(GitCommand, RootDirOp):
         git_root_dir: Path = Path.cwd(),
         runner: GitCommandRunner = SimpleGitCR(),
         *,
+        async_runner: AsyncGitCommandRunner | None = None,
         version_subcmd: VersionCommand | None = None,
         ls_tree_subcmd: LsTreeCommand | None = None,
         add_subcmd: AddCommand | None = None,
         subcmd_unchecked: UncheckedSubcmd | None = None,
     ):
-        super().__init__(runner)
+        super().__init__(runner, async_runner)
         self.git_root_dir = git_root_dir
         self._version_subcmd = version_subcmd or VersionCommandImpl(self)
         self._ls_tree = ls_tree_subcmd or LsTreeCommandImpl(self.root_dir, self)
@@ -228,6 +236,7 @@ class SimpleGitCommand(GitCommand, RootDirOp):
         return SimpleGitCommand(
             self.root_dir,
             self.runner,
+            async_runner=self.async_runner,
             version_subcmd=self.version_subcmd,
             ls_tree_subcmd=self.ls_tree_subcmd,
             add_subcmd=self.add_subcmd,
@@ -256,6 +265,7 @@ class CLISimpleGitCommand(SimpleGitCommand):
         git_root_dir: Path = Path.cwd(),
         runner: GitCommandRunner = SimpleGitCR(),
         *,
+        async_runner: AsyncGitCommandRunner | None = None,
         opts: list[str] | None = None,
         envs: dict[str, str] | None = None,
         prefer_cli: bool = False,
@@ -275,6 +285,7 @@ class CLISimpleGitCommand(SimpleGitCommand):
         super().__init__(
             git_root_dir,
             runner,
+            async_runner=async_runner,
             version_subcmd=version_subcmd,
             ls_tree_subcmd=ls_tree_subcmd,
             add_subcmd=add_subcmd,
@@ -307,6 +318,7 @@ class CLISimpleGitCommand(SimpleGitCommand):
         return CLISimpleGitCommand(
             self.root_dir,
             self.runner,
+            async_runner=self.async_runner,
             opts=self._main_cmd_cli_opts,
             envs=self._cmd_cli_envs,
             prefer_cli=self.prefer_cli,
@@ -6,7 +6,9 @@ Helper interfaces for ``git ls-tree`` subcommand with default implementation for
 """
 
 from abc import abstractmethod
-from typing import Protocol, Unpack, override
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, ClassVar, Final, Protocol, Unpack, override
 
 from gitbolt.git_subprocess.constants import LS_TREE_CMD
 from gitbolt.models import GitLsTreeOpts
@@ -49,7 +51,23 @@ class IndividuallyOverridableLTCAB(LsTreeCLIArgsBuilder):
 
     Build CLI args to run ``git ls-tree`` subcommand in a subprocess. This class is independent in its working and
     provides interface to individually override each arg former for fine-grained control.
+
+    Which arg formers a subclass overrides is worked out once, when the subclass is defined, so that ``build()`` only
+    dispatches to the overridden ones and forms every other arg directly.
+    """
+
+    _overridden_arg_formers: ClassVar[frozenset[str]] = frozenset()
     """
+    Names of the arg formers overridden by this class. Empty for this class itself.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._overridden_arg_formers = frozenset(
+            name
+            for name in _LS_TREE_ARG_FORMERS
+            if getattr(cls, name) is not getattr(IndividuallyOverridableLTCAB, name)
+        )
 
     @override
     def build(self, tree_ish: str, **ls_tree_opts: Unpack[GitLsTreeOpts]) -> list[str]:
@@ -165,25 +183,59 @@ class IndividuallyOverridableLTCAB(LsTreeCLIArgsBuilder):
         ...             path=[],
         ...             format_=None) # type: ignore[arg-type] # expected str provided None
         ['ls-tree', 'HEAD']
-        """
-        sub_cmd_args = [LS_TREE_CMD]
-
-        sub_cmd_args.extend(self.d_arg(ls_tree_opts.get("d")))
-        sub_cmd_args.extend(self.r_arg(ls_tree_opts.get("r")))
-        sub_cmd_args.extend(self.t_arg(ls_tree_opts.get("t")))
-        sub_cmd_args.extend(self.long_arg(ls_tree_opts.get("long")))
-        sub_cmd_args.extend(self.z_arg(ls_tree_opts.get("z")))
-        sub_cmd_args.extend(self.name_only_arg(ls_tree_opts.get("name_only")))
-        sub_cmd_args.extend(self.name_status_arg(ls_tree_opts.get("name_status")))
-        sub_cmd_args.extend(self.object_only_arg(ls_tree_opts.get("object_only")))
-        sub_cmd_args.extend(self.full_name_arg(ls_tree_opts.get("full_name")))
-        sub_cmd_args.extend(self.full_tree_arg(ls_tree_opts.get("full_tree")))
-
-        sub_cmd_args.extend(self.abbrev_arg(ls_tree_opts.get("abbrev")))
-        sub_cmd_args.extend(self.format_arg(ls_tree_opts.get("format_")))
 
-        sub_cmd_args.extend(self.tree_ish_arg(tree_ish))
-        sub_cmd_args.extend(self.path_args(ls_tree_opts.get("path")))
+        * Subclasses produce the same args unless they override any arg formers, and only the overridden arg formers
+          are called::
+
+        >>> class _Sub(IndividuallyOverridableLTCAB):
+        ...     pass
+        >>> _opts = dict(r=True, name_only=True, abbrev=7, format_="%(path)", path=["a", "b"])
+        >>> _Sub().build("HEAD", **_opts) == builder.build("HEAD", **_opts)
+        True
+        >>> class _EqualsFormat(IndividuallyOverridableLTCAB):
+        ...     def format_arg(self, _format):
+        ...         return [f"--format={_format}"] if _format is not None else []
+        >>> sorted(_EqualsFormat._overridden_arg_formers)
+        ['format_arg']
+        >>> _EqualsFormat().build("HEAD", **_opts)
+        ['ls-tree', '-r', '--name-only', '--abbrev=7', '--format=%(path)', 'HEAD', 'a', 'b']
+        """
+        overridden = self._overridden_arg_formers
+        if not overridden:
+            return _build_ls_tree_args(tree_ish, ls_tree_opts)
+
+        get: Callable[[str], Any] = ls_tree_opts.get
+        sub_cmd_args = [LS_TREE_CMD]
+        append = sub_cmd_args.append
+        extend = sub_cmd_args.extend
+
+        for key, flag, former in _LS_TREE_BOOL_FLAGS:
+            if former in overridden:
+                extend(getattr(self, former)(get(key)))
+            elif get(key):
+                append(flag)
+
+        abbrev = get("abbrev")
+        if "abbrev_arg" in overridden:
+            extend(self.abbrev_arg(abbrev))
+        elif abbrev is not None:
+            append(_abbrev_flag(abbrev))
+        _format = get("format_")
+        if "format_arg" in overridden:
+            extend(self.format_arg(_format))
+        elif _format is not None:
+            append("--format")
+            append(_format)
+
+        if "tree_ish_arg" in overridden:
+            extend(self.tree_ish_arg(tree_ish))
+        else:
+            append(tree_ish)
+        path = get("path")
+        if "path_args" in overridden:
+            extend(self.path_args(path))
+        elif path:
+            extend(path)
 
         return sub_cmd_args
 
@@ -348,7 +400,7 @@ class IndividuallyOverridableLTCAB(LsTreeCLIArgsBuilder):
         >>> IndividuallyOverridableLTCAB().abbrev_arg(40)
         ['--abbrev=40']
         """
-        return [f"--abbrev={abbrev}"] if abbrev is not None else []
+        return [_abbrev_flag(abbrev)] if abbrev is not None else []
 
     def format_arg(self, _format: str | None) -> list[str]:
         """
@@ -394,7 +446,8 @@ class IndividuallyOverridableLTCAB(LsTreeCLIArgsBuilder):
         """
         Return the list of paths (if any) passed to ``git ls-tree``.
 
-        If `path` is None or an empty list, this returns an empty list.
+        If `path` is None or an empty list, this returns an empty list. Otherwise, a copy of `path` is returned so
+        that overrides can extend the returned list without touching the caller's one.
 
         >>> IndividuallyOverridableLTCAB().path_args(["src", "README.md"])
         ['src', 'README.md']
@@ -402,5 +455,185 @@ class IndividuallyOverridableLTCAB(LsTreeCLIArgsBuilder):
         []
         >>> IndividuallyOverridableLTCAB().path_args(None)
         []
+        >>> _paths = ["src"]
+        >>> IndividuallyOverridableLTCAB().path_args(_paths) is _paths
+        False
+
+        Overrides can extend what this returns:
+
+        >>> class _WithReadme(IndividuallyOverridableLTCAB):
+        ...     def path_args(self, path):
+        ...         return super().path_args(path) + ["README.md"]
+        >>> _WithReadme().build("HEAD", path=_paths)
+        ['ls-tree', 'HEAD', 'src', 'README.md']
+        >>> _WithReadme().build("HEAD")
+        ['ls-tree', 'HEAD', 'README.md']
+        >>> _paths
+        ['src']
         """
-        return path if path else []
+        return list(path) if path else []
+
+
+def build_ls_tree_argv(
+    tree_ish: str, **ls_tree_opts: Unpack[GitLsTreeOpts]
+) -> list[str]:
+    """
+    Build the ``git ls-tree`` subcommand args, exactly as ``IndividuallyOverridableLTCAB().build()`` does, without
+    going through a builder instance.
+
+    Meant for callers that build args for many ``ls-tree`` invocations and do not need to override any arg former.
+    Like the builders, this does not validate the arguments.
+
+    >>> build_ls_tree_argv("HEAD")
+    ['ls-tree', 'HEAD']
+    >>> build_ls_tree_argv("HEAD", r=True, name_only=True, path=["src"])
+    ['ls-tree', '-r', '--name-only', 'HEAD', 'src']
+    >>> _opts = dict(d=True, z=True, abbrev=12, format_="%(objectname)", path=["a", "b"])
+    >>> build_ls_tree_argv("main", **_opts) == IndividuallyOverridableLTCAB().build("main", **_opts)
+    True
+
+    :param tree_ish: A tree-ish identifier (commit SHA, branch name, etc.).
+    :param ls_tree_opts: Keyword arguments mapping to supported options for ``git ls-tree``.
+    :return: Complete list of subcommand arguments.
+    """
+    return _build_ls_tree_args(tree_ish, ls_tree_opts)
+
+
+_LS_TREE_BOOL_FLAGS: Final[tuple[tuple[str, str, str], ...]] = (
+    ("d", "-d", "d_arg"),
+    ("r", "-r", "r_arg"),
+    ("t", "-t", "t_arg"),
+    ("long", "-l", "long_arg"),
+    ("z", "-z", "z_arg"),
+    ("name_only", "--name-only", "name_only_arg"),
+    ("name_status", "--name-status", "name_status_arg"),
+    ("object_only", "--object-only", "object_only_arg"),
+    ("full_name", "--full-name", "full_name_arg"),
+    ("full_tree", "--full-tree", "full_tree_arg"),
+)
+"""
+``GitLsTreeOpts`` bool keys with their flags and ``IndividuallyOverridableLTCAB`` arg formers, in the order they are
+emitted.
+"""
+
+_LS_TREE_ARG_FORMERS: Final[tuple[str, ...]] = (
+    *(former for *_, former in _LS_TREE_BOOL_FLAGS),
+    "abbrev_arg",
+    "format_arg",
+    "tree_ish_arg",
+    "path_args",
+)
+"""
+All the individually overridable arg formers of ``IndividuallyOverridableLTCAB``.
+"""
+
+_LS_TREE_PREFIX_KEYS: Final[tuple[str, ...]] = (
+    *(key for key, *_ in _LS_TREE_BOOL_FLAGS),
+    "abbrev",
+    "format_",
+)
+"""
+``GitLsTreeOpts`` keys that decide the args emitted before ``tree-ish``, in the order they are emitted.
+"""
+
+
+def _build_ls_tree_args(tree_ish: str, ls_tree_opts: GitLsTreeOpts) -> list[str]:
+    """
+    Equivalent of ``IndividuallyOverridableLTCAB.build()`` used when none of its arg formers are overridden.
+
+    The args before ``tree-ish`` only depend on the options, so they are built once per option combination and
+    reused for every ``tree-ish`` and ``path`` queried with the same options. Option values are cached along with
+    their types as ``1 == True`` and ``0 == False``.
+
+    >>> _table_keys = [k for k, *_ in _LS_TREE_BOOL_FLAGS]
+    >>> sorted(_table_keys + ["abbrev", "format_", "path"]) == sorted(GitLsTreeOpts.__annotations__)
+    True
+    >>> _formers = [n for n in vars(IndividuallyOverridableLTCAB) if n.endswith(("_arg", "_args"))]
+    >>> sorted(_LS_TREE_ARG_FORMERS) == sorted(_formers)
+    True
+
+    >>> _build_ls_tree_args("HEAD", {"r": True, "z": True, "abbrev": 7, "path": ["a"]})
+    ['ls-tree', '-r', '-z', '--abbrev=7', 'HEAD', 'a']
+    >>> _build_ls_tree_args("main", {"r": True, "z": True, "abbrev": 7})
+    ['ls-tree', '-r', '-z', '--abbrev=7', 'main']
+
+    Equal option values of different types are not mixed up:
+
+    >>> _build_ls_tree_args("HEAD", {"abbrev": True})  # type: ignore[typeddict-item] # abbrev expects int
+    ['ls-tree', '--abbrev=True', 'HEAD']
+    >>> _build_ls_tree_args("HEAD", {"abbrev": 1})
+    ['ls-tree', '--abbrev=1', 'HEAD']
+    >>> _build_ls_tree_args("HEAD", {"abbrev": 0})
+    ['ls-tree', '--abbrev=0', 'HEAD']
+    >>> _build_ls_tree_args("HEAD", {"abbrev": False})  # type: ignore[typeddict-item] # abbrev expects int
+    ['ls-tree', '--abbrev=False', 'HEAD']
+
+    Unhashable option values, only possible if the options are not validated, are built without caching:
+
+    >>> _build_ls_tree_args("HEAD", {"r": [True]})
+    ['ls-tree', '-r', 'HEAD']
+    """
+    get: Callable[[str], Any] = ls_tree_opts.get
+    prefix_opts = tuple((type(val), val) for val in map(get, _LS_TREE_PREFIX_KEYS))
+    try:
+        prefix = _ls_tree_args_prefix(prefix_opts)
+    except TypeError:
+        prefix = _ls_tree_args_prefix.__wrapped__(prefix_opts)
+    sub_cmd_args = [*prefix, tree_ish]
+    path = get("path")
+    if path:
+        sub_cmd_args.extend(path)
+    return sub_cmd_args
+
+
+@lru_cache(maxsize=128)
+def _ls_tree_args_prefix(
+    prefix_opts: tuple[tuple[type, Any], ...],
+) -> tuple[str, ...]:
+    """
+    :param prefix_opts: ``(type(value), value)`` of the ``_LS_TREE_PREFIX_KEYS`` options, in that order. Value types
+        are a part of the cache key as ``1 == True``.
+    :return: ``ls-tree`` args emitted before ``tree-ish`` for the given option values.
+
+    >>> _flags = ((bool, True), *((bool, False),) * 3, (bool, True), *((bool, False),) * 5)
+    >>> _ls_tree_args_prefix((*_flags, (int, 7), (str, "%(path)")))
+    ('ls-tree', '-d', '-z', '--abbrev=7', '--format', '%(path)')
+    >>> _ls_tree_args_prefix(((type(None), None),) * 12)
+    ('ls-tree',)
+    """
+    *flag_vals, abbrev, _format = (val for _, val in prefix_opts)
+    return (
+        LS_TREE_CMD,
+        *(flag for (_, flag, _), val in zip(_LS_TREE_BOOL_FLAGS, flag_vals) if val),
+        *((_abbrev_flag(abbrev),) if abbrev is not None else ()),
+        *(("--format", _format) if _format is not None else ()),
+    )
+
+
+_ABBREV_FLAGS: Final[tuple[str, ...]] = tuple(f"--abbrev={n}" for n in range(41))
+"""
+``--abbrev=N`` flags for every valid ``N`` (0-40 inclusive), indexed by ``N``.
+"""
+
+
+def _abbrev_flag(abbrev: int) -> str:
+    """
+    ``--abbrev=N`` flag, looked up from the precomputed flags for a valid ``N``.
+
+    >>> _abbrev_flag(7)
+    '--abbrev=7'
+    >>> _abbrev_flag(7) is _abbrev_flag(7)
+    True
+    >>> _abbrev_flag(0), _abbrev_flag(40)
+    ('--abbrev=0', '--abbrev=40')
+
+    Values out of range are formatted as-is and left for git to reject:
+
+    >>> _abbrev_flag(41)
+    '--abbrev=41'
+    >>> _abbrev_flag(True)
+    '--abbrev=True'
+    """
+    if type(abbrev) is int and 0 <= abbrev <= 40:
+        return _ABBREV_FLAGS[abbrev]
+    return f"--abbrev={abbrev}"
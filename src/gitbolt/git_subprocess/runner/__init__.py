@@ -5,4 +5,7 @@
 Git command runners to run subprocess calls.
 """
 
+from gitbolt.git_subprocess.runner.base import (
+    AsyncGitCommandRunner as AsyncGitCommandRunner,
+)
 from gitbolt.git_subprocess.runner.base import GitCommandRunner as GitCommandRunner
@@ -8,21 +8,25 @@ Git command runner interfaces to run subprocess calls.
 from __future__ import annotations
 
 from abc import abstractmethod
-from subprocess import CompletedProcess
+from collections.abc import Sequence
+from subprocess import CompletedProcess, Popen
 from typing import Protocol, overload, Any, Literal
 
 
 class GitCommandRunner(Protocol):
     """
     Interface to facilitate running git commands in subprocess.
+
+    ``main_cmd_args`` and ``subcommand_args`` are accepted as any ``Sequence`` so that callers can pass prebuilt or
+    cached tuples as-is. Implementations assemble the final ``argv`` from them in a single pass.
     """
 
     @overload
     @abstractmethod
     def run_git_command(
         self,
-        main_cmd_args: list[str],
-        subcommand_args: list[str],
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
         *subprocess_run_args: Any,
         _input: str,
         text: Literal[True],
@@ -33,8 +37,8 @@ class GitCommandRunner(Protocol):
     @abstractmethod
     def run_git_command(
         self,
-        main_cmd_args: list[str],
-        subcommand_args: list[str],
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
         *subprocess_run_args: Any,
         _input: bytes,
         text: Literal[False],
@@ -45,8 +49,8 @@ class GitCommandRunner(Protocol):
     @abstractmethod
     def run_git_command(
         self,
-        main_cmd_args: list[str],
-        subcommand_args: list[str],
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
         *subprocess_run_args: Any,
         text: Literal[True],
         **subprocess_run_kwargs: Any,
@@ -56,9 +60,83 @@ class GitCommandRunner(Protocol):
     @abstractmethod
     def run_git_command(
         self,
-        main_cmd_args: list[str],
-        subcommand_args: list[str],
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
         *subprocess_run_args: Any,
         text: Literal[False] = ...,
         **subprocess_run_kwargs: Any,
     ) -> CompletedProcess[bytes]: ...
+
+    def popen_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        **popen_kwargs: Any,
+    ) -> Popen:
+        """
+        Start a git command in a subprocess without waiting for it to finish. Used by callers that stream the output
+        of the command rather than buffering all of it.
+
+        Optional for runners. By default, streaming is not supported and callers fall back to ``run_git_command()``.
+
+        :param main_cmd_args: main command args of the git invocation.
+        :param subcommand_args: subcommand args of the git invocation.
+        :param popen_kwargs: keyword arguments for ``subprocess.Popen``.
+        :return: the started process. The caller owns it and must wait for it.
+        :raises NotImplementedError: if this runner cannot stream git commands.
+        """
+        raise NotImplementedError
+
+
+class AsyncGitCommandRunner(Protocol):
+    """
+    Interface to facilitate running git commands in an ``asyncio`` subprocess.
+
+    Lets callers overlap the process spawn and I/O wait of multiple independent git commands.
+    """
+
+    @overload
+    @abstractmethod
+    async def arun_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *,
+        _input: str,
+        text: Literal[True],
+        **subprocess_exec_kwargs: Any,
+    ) -> CompletedProcess[str]: ...
+
+    @overload
+    @abstractmethod
+    async def arun_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *,
+        _input: bytes,
+        text: Literal[False],
+        **subprocess_exec_kwargs: Any,
+    ) -> CompletedProcess[bytes]: ...
+
+    @overload
+    @abstractmethod
+    async def arun_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *,
+        text: Literal[True],
+        **subprocess_exec_kwargs: Any,
+    ) -> CompletedProcess[str]: ...
+
+    @overload
+    @abstractmethod
+    async def arun_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *,
+        text: Literal[False] = ...,
+        **subprocess_exec_kwargs: Any,
+    ) -> CompletedProcess[bytes]: ...
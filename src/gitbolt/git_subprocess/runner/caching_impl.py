@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+A git command subprocess runner implementation that reuses results of invocations whose output only depends on the
+installed git.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+from collections.abc import Sequence
+from subprocess import CompletedProcess, Popen
+from typing import overload, override, Any, Literal, Final
+
+from gitbolt.git_subprocess.constants import VERSION_CMD
+from gitbolt.git_subprocess.runner import GitCommandRunner
+from gitbolt.git_subprocess.runner.simple_impl import SimpleGitCR
+
+INSTALLATION_BOUND_SUBCMDS: Final[frozenset[tuple[str, ...]]] = frozenset(
+    {(VERSION_CMD,), (VERSION_CMD, "--build-options")}
+)
+"""
+Subcommand arg lists whose output is decided by the installed git alone.
+"""
+
+INSTALLATION_BOUND_MAIN_CMD_OPTS: Final[frozenset[str]] = frozenset(
+    {"--exec-path", "--html-path", "--info-path", "--man-path"}
+)
+"""
+Main command options which, run without a subcommand, print a path decided by the installed git alone.
+"""
+
+INHERITED_ENV_KEYS: Final[tuple[str, ...]] = ("PATH", "GIT_EXEC_PATH")
+"""
+Env vars deciding which installed git runs, and so the output of the installation-bound invocations, when the
+environment is inherited rather than passed as ``env``.
+"""
+
+
+class CachingGitCR(GitCommandRunner):
+    """
+    Git command runner that runs installation-bound invocations, like ``git version`` or ``git --exec-path``, only
+    once and serves their later calls from memory. Every other invocation is delegated as-is to the ``delegate``
+    runner.
+
+    Only successful, output-capturing invocations without stdin are reused. Invocations differing in any of the
+    main command args, subcommand args, env vars, ``cwd`` or ``text`` mode are considered different. Invocations
+    inheriting the environment, i.e. run without ``env``, are told apart by the inherited ``INHERITED_ENV_KEYS``. Every
+    caller gets its own copy of the reused result.
+
+    >>> runner = CachingGitCR()
+    >>> runner.is_installation_bound(["--no-pager"], ["version"])
+    True
+    >>> runner.is_installation_bound(["--exec-path"], [])
+    True
+    >>> runner.is_installation_bound([], ["ls-tree", "HEAD"])
+    False
+    """
+
+    def __init__(self, delegate: GitCommandRunner | None = None):
+        """
+        :param delegate: runner that actually runs the git commands. Defaults to ``SimpleGitCR``.
+        """
+        self.delegate: GitCommandRunner = delegate or SimpleGitCR()
+        self._results: dict[tuple, CompletedProcess] = {}
+
+    @staticmethod
+    def is_installation_bound(
+        main_cmd_args: Sequence[str], subcommand_args: Sequence[str]
+    ) -> bool:
+        """
+        :param main_cmd_args: main command args of the git invocation.
+        :param subcommand_args: subcommand args of the git invocation.
+        :return: ``True`` if the output of the invocation is decided by the installed git alone.
+        """
+        if subcommand_args:
+            return tuple(subcommand_args) in INSTALLATION_BOUND_SUBCMDS
+        return bool(main_cmd_args) and (
+            main_cmd_args[-1] in INSTALLATION_BOUND_MAIN_CMD_OPTS
+        )
+
+    def clear(self) -> None:
+        """
+        Forget all the reused results. Useful if the installed git changes during the lifetime of this runner.
+        """
+        self._results.clear()
+
+    @overload
+    @override
+    def run_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *subprocess_run_args: Any,
+        _input: str,
+        text: Literal[True],
+        **subprocess_run_kwargs: Any,
+    ) -> CompletedProcess[str]: ...
+
+    @overload
+    @override
+    def run_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *subprocess_run_args: Any,
+        _input: bytes,
+        text: Literal[False],
+        **subprocess_run_kwargs: Any,
+    ) -> CompletedProcess[bytes]: ...
+
+    @overload
+    @override
+    def run_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *subprocess_run_args: Any,
+        text: Literal[True],
+        **subprocess_run_kwargs: Any,
+    ) -> CompletedProcess[str]: ...
+
+    @overload
+    @override
+    def run_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *subprocess_run_args: Any,
+        text: Literal[False] = ...,
+        **subprocess_run_kwargs: Any,
+    ) -> CompletedProcess[bytes]: ...
+
+    @override
+    def run_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *subprocess_run_args: Any,
+        _input: str | bytes | None = None,
+        text: Literal[True, False] = False,
+        **subprocess_run_kwargs: Any,
+    ) -> CompletedProcess[str] | CompletedProcess[bytes]:
+        reusable = (
+            _input is None
+            and not subprocess_run_args
+            and subprocess_run_kwargs.get("capture_output", False)
+            and self.is_installation_bound(main_cmd_args, subcommand_args)
+        )
+        if not reusable:
+            return self.delegate.run_git_command(
+                main_cmd_args,
+                subcommand_args,
+                *subprocess_run_args,
+                _input=_input,  # type: ignore[arg-type] # same overload as the one this method was called with
+                text=text,
+                **subprocess_run_kwargs,
+            )
+
+        env = subprocess_run_kwargs.get("env")
+        env_key: tuple[str | None, ...] | frozenset[tuple[str, str]]
+        if env is None:
+            env_key = tuple(os.environ.get(name) for name in INHERITED_ENV_KEYS)
+        else:
+            env_key = frozenset(env.items())
+        key = (
+            tuple(main_cmd_args),
+            tuple(subcommand_args),
+            text,
+            subprocess_run_kwargs.get("cwd"),
+            env_key,
+        )
+        result = self._results.get(key)
+        if result is None:
+            result = self.delegate.run_git_command(
+                main_cmd_args,
+                subcommand_args,
+                text=text,
+                **subprocess_run_kwargs,
+            )
+            if result.returncode == 0:
+                self._results[key] = result
+        return copy.copy(result)
+
+    @override
+    def popen_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        **popen_kwargs: Any,
+    ) -> Popen:
+        return self.delegate.popen_git_command(
+            main_cmd_args, subcommand_args, **popen_kwargs
+        )
@@ -7,13 +7,16 @@ A simple and straight-forward git command subprocess runner implementation.
 
 from __future__ import annotations
 
+import asyncio
+import locale
 import subprocess
-from subprocess import CompletedProcess
+from collections.abc import Sequence
+from subprocess import CompletedProcess, Popen
 from typing import overload, override, Any, Literal
 
 from gitbolt.git_subprocess.constants import GIT_CMD
 from gitbolt.git_subprocess.exceptions import GitCmdException
-from gitbolt.git_subprocess.runner import GitCommandRunner
+from gitbolt.git_subprocess.runner import GitCommandRunner, AsyncGitCommandRunner
 
 
 class SimpleGitCR(GitCommandRunner):
@@ -25,8 +28,8 @@ class SimpleGitCR(GitCommandRunner):
     @override
     def run_git_command(
         self,
-        main_cmd_args: list[str],
-        subcommand_args: list[str],
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
         *subprocess_run_args: Any,
         _input: str,
         text: Literal[True],
@@ -37,8 +40,8 @@ class SimpleGitCR(GitCommandRunner):
     @override
     def run_git_command(
         self,
-        main_cmd_args: list[str],
-        subcommand_args: list[str],
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
         *subprocess_run_args: Any,
         _input: bytes,
         text: Literal[False],
@@ -49,8 +52,8 @@ class SimpleGitCR(GitCommandRunner):
     @override
     def run_git_command(
         self,
-        main_cmd_args: list[str],
-        subcommand_args: list[str],
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
         *subprocess_run_args: Any,
         text: Literal[True],
         **subprocess_run_kwargs: Any,
@@ -60,8 +63,8 @@ class SimpleGitCR(GitCommandRunner):
     @override
     def run_git_command(
         self,
-        main_cmd_args: list[str],
-        subcommand_args: list[str],
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
         *subprocess_run_args: Any,
         text: Literal[False] = ...,
         **subprocess_run_kwargs: Any,
@@ -70,8 +73,8 @@ class SimpleGitCR(GitCommandRunner):
     @override
     def run_git_command(
         self,
-        main_cmd_args: list[str],
-        subcommand_args: list[str],
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
         *subprocess_run_args: Any,
         _input: str | bytes | None = None,
         text: Literal[True, False] = False,
@@ -89,3 +92,129 @@ class SimpleGitCR(GitCommandRunner):
             raise GitCmdException(
                 e.stderr, called_process_error=e, exit_code=e.returncode
             ) from e
+
+    @override
+    def popen_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        **popen_kwargs: Any,
+    ) -> Popen:
+        return Popen([GIT_CMD, *main_cmd_args, *subcommand_args], **popen_kwargs)
+
+
+class SimpleAsyncGitCR(AsyncGitCommandRunner):
+    """
+    Simple async git command runner that runs everything `as-is` in an ``asyncio`` subprocess.
+
+    Mirrors ``SimpleGitCR`` semantics for the ``check``, ``capture_output`` and ``text`` keyword arguments so that
+    results from both runners are interchangeable.
+    """
+
+    @overload
+    @override
+    async def arun_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *,
+        _input: str,
+        text: Literal[True],
+        **subprocess_exec_kwargs: Any,
+    ) -> CompletedProcess[str]: ...
+
+    @overload
+    @override
+    async def arun_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *,
+        _input: bytes,
+        text: Literal[False],
+        **subprocess_exec_kwargs: Any,
+    ) -> CompletedProcess[bytes]: ...
+
+    @overload
+    @override
+    async def arun_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *,
+        text: Literal[True],
+        **subprocess_exec_kwargs: Any,
+    ) -> CompletedProcess[str]: ...
+
+    @overload
+    @override
+    async def arun_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *,
+        text: Literal[False] = ...,
+        **subprocess_exec_kwargs: Any,
+    ) -> CompletedProcess[bytes]: ...
+
+    @override
+    async def arun_git_command(
+        self,
+        main_cmd_args: Sequence[str],
+        subcommand_args: Sequence[str],
+        *,
+        _input: str | bytes | None = None,
+        text: Literal[True, False] = False,
+        **subprocess_exec_kwargs: Any,
+    ) -> CompletedProcess[str] | CompletedProcess[bytes]:
+        check = subprocess_exec_kwargs.pop("check", False)
+        if subprocess_exec_kwargs.pop("capture_output", False):
+            subprocess_exec_kwargs["stdout"] = asyncio.subprocess.PIPE
+            subprocess_exec_kwargs["stderr"] = asyncio.subprocess.PIPE
+        if _input is not None:
+            subprocess_exec_kwargs["stdin"] = asyncio.subprocess.PIPE
+        encoding = locale.getpreferredencoding(False)
+        if isinstance(_input, str):
+            _input = _input.encode(encoding)
+
+        args = [GIT_CMD, *main_cmd_args, *subcommand_args]
+        proc = await asyncio.create_subprocess_exec(*args, **subprocess_exec_kwargs)
+        stdout, stderr = await proc.communicate(_input)
+        returncode = await proc.wait()
+
+        result: CompletedProcess[str] | CompletedProcess[bytes]
+        if text:
+            result = CompletedProcess(
+                args,
+                returncode,
+                _translate_newlines(stdout, encoding),
+                _translate_newlines(stderr, encoding),
+            )
+        else:
+            result = CompletedProcess(args, returncode, stdout, stderr)
+        if check and returncode:
+            e = subprocess.CalledProcessError(
+                returncode, args, output=result.stdout, stderr=result.stderr
+            )
+            raise GitCmdException(
+                e.stderr, called_process_error=e, exit_code=returncode
+            ) from e
+        return result
+
+
+def _translate_newlines(data: bytes | None, encoding: str) -> str | None:
+    """
+    Decode subprocess output the same way ``subprocess.run(..., text=True)`` does.
+
+    >>> _translate_newlines(b"a\\r\\nb\\rc\\n", "utf-8")
+    'a\\nb\\nc\\n'
+    >>> _translate_newlines(None, "utf-8") is None
+    True
+
+    :param data: raw bytes captured from the subprocess, ``None`` if the stream was not captured.
+    :param encoding: encoding to decode ``data`` with.
+    :return: decoded text with universal newlines, ``None`` if ``data`` was ``None``.
+    """
+    if data is None:
+        return None
+    return data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
@@ -5,15 +5,21 @@
 Utility functions related to processors specific to git commands using subprocess.
 """
 
-from collections.abc import Sequence
+import asyncio
+import os
+from collections.abc import Awaitable, Coroutine, Iterator, Mapping, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, IO
 
 from vt.utils.commons.commons.core_py import is_unset, not_none_not_unset, Unset
+from vt.utils.errors.error_specs import ERR_INVALID_USAGE
+from vt.utils.errors.error_specs.utils import require_type
+
+from gitbolt.exceptions import GitExitingException
 
 
 def git_main_cmd_repeating_flag_args(
-    val: Sequence[Path] | Unset | None, cmd_flag: str
+    val: Sequence[Path | str | Unset] | Unset | None, cmd_flag: str
 ) -> list[str]:
     """
     Returns a flattened list of repeating flags and values.
@@ -55,7 +61,7 @@ def git_main_cmd_repeating_flag_args(
 
 
 def git_main_cmd_dict_flag_args(
-    val: dict[str, str | bool | None | Unset] | None | Unset, cmd_flag: str
+    val: Mapping[str, str | bool | None | Unset] | None | Unset, cmd_flag: str
 ) -> list[str]:
     """
     Converts a dictionary into flag pairs used by commands like `-c key=value`.
@@ -177,3 +183,125 @@ def git_main_cmd_pair_flag_args(val: Any, cmd_flag: str) -> list[str]:
         []
     """
     return [cmd_flag, str(val)] if not_none_not_unset(val) else []
+
+
+def default_max_concurrent_git() -> int:
+    """
+    Default cap on the number of git subprocesses run concurrently by ``gather_git()``.
+
+    Three quarters of the available CPUs, but at least one.
+
+    Returns:
+        The default concurrency cap.
+
+    Examples:
+        >>> default_max_concurrent_git() >= 1
+        True
+    """
+    return max(1, 3 * (os.cpu_count() or 1) // 4)
+
+
+async def gather_git[T](
+    *calls: Awaitable[T], max_concurrent: int | None = None
+) -> list[T]:
+    """
+    Await multiple async git calls (like ``als_tree()``, ``aadd()``, ``aversion()``) concurrently so that their
+    subprocess spawn and I/O wait overlap, while running at most ``max_concurrent`` of them at any time.
+
+    Args:
+        calls: awaitables of async git calls.
+        max_concurrent: maximum number of calls awaited at once. Defaults to ``default_max_concurrent_git()``.
+
+    Returns:
+        Results of the ``calls``, in the order the ``calls`` were supplied.
+
+    Examples:
+        >>> async def _echo(x):
+        ...     return x
+        >>> asyncio.run(gather_git(_echo(1), _echo(2), _echo(3), max_concurrent=2))
+        [1, 2, 3]
+
+        >>> asyncio.run(gather_git())
+        []
+
+        >>> asyncio.run(gather_git(max_concurrent=0))
+        Traceback (most recent call last):
+        gitbolt.exceptions.GitExitingException: ValueError: max_concurrent must be a positive int.
+
+        >>> asyncio.run(gather_git(max_concurrent="2")) # type: ignore[arg-type] # expects int
+        Traceback (most recent call last):
+        gitbolt.exceptions.GitExitingException: TypeError: 'max_concurrent' must be an int
+
+        Calls are closed, rather than left un-awaited, when ``max_concurrent`` is invalid:
+
+        >>> import inspect
+        >>> call = _echo(1)
+        >>> asyncio.run(gather_git(call, max_concurrent=0))
+        Traceback (most recent call last):
+        gitbolt.exceptions.GitExitingException: ValueError: max_concurrent must be a positive int.
+        >>> inspect.getcoroutinestate(call)
+        'CORO_CLOSED'
+    """
+    if max_concurrent is None:
+        max_concurrent = default_max_concurrent_git()
+    try:
+        require_type(max_concurrent, "max_concurrent", int, GitExitingException)
+        if max_concurrent < 1:
+            errmsg = "max_concurrent must be a positive int."
+            raise GitExitingException(
+                errmsg, exit_code=ERR_INVALID_USAGE
+            ) from ValueError(errmsg)
+    except GitExitingException:
+        # the calls are created by the caller before this validation can run, close the ones that are coroutines so
+        # that they are not reported as never awaited.
+        for call in calls:
+            if isinstance(call, Coroutine):
+                call.close()
+        raise
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _bounded(call: Awaitable[T]) -> T:
+        async with semaphore:
+            return await call
+
+    return list(await asyncio.gather(*(_bounded(call) for call in calls)))
+
+
+def iter_records(
+    stream: IO[str], separator: str = "\n", chunk_size: int = 64 * 1024
+) -> Iterator[str]:
+    """
+    Lazily split a text stream into records terminated (or separated) by ``separator``.
+
+    Only one chunk of the stream is held in memory at a time, which lets callers process large git outputs while
+    git is still producing them.
+
+    Args:
+        stream: text stream to read records from.
+        separator: record separator, like ``"\\n"`` or ``"\\0"`` for NUL-terminated (``-z``) git outputs.
+        chunk_size: number of characters read from the stream at a time.
+
+    Returns:
+        An iterator over the records, without their separators.
+
+    Examples:
+        >>> from io import StringIO
+        >>> list(iter_records(StringIO("a\\nb\\nc\\n")))
+        ['a', 'b', 'c']
+
+        >>> list(iter_records(StringIO("a\\0bb\\0ccc\\0"), "\\0", chunk_size=2))
+        ['a', 'bb', 'ccc']
+
+        >>> list(iter_records(StringIO("no-trailing\\nseparator"), chunk_size=3))
+        ['no-trailing', 'separator']
+
+        >>> list(iter_records(StringIO("")))
+        []
+    """
+    pending = ""
+    while chunk := stream.read(chunk_size):
+        *records, pending = (pending + chunk).split(separator)
+        yield from records
+    if pending:
+        yield pending
@@ -6,7 +6,8 @@ Helper interfaces specific to ``git ls-tree`` subcommand.
 """
 
 from abc import abstractmethod
-from typing import Protocol, Unpack, override, Literal
+from functools import lru_cache
+from typing import Protocol, Unpack, override, Any, Final, cast
 
 from vt.utils.errors.error_specs import ERR_INVALID_USAGE
 from vt.utils.errors.error_specs.utils import require_type, require_iterable
@@ -99,57 +100,126 @@ class UtilLsTreeArgsValidator(LsTreeArgsValidator):
             Traceback (most recent call last):
             gitbolt.exceptions.GitExitingException: TypeError: 'path' must be a non-str iterable
 
+            >>> UtilLsTreeArgsValidator().validate("HEAD",
+            ...                       path=("src/",))  # type: ignore[arg-type] as path expects list[str] and tuple is provided.
+            Traceback (most recent call last):
+            gitbolt.exceptions.GitExitingException: TypeError: 'path' must be of type list
+
+            >>> UtilLsTreeArgsValidator().validate("HEAD",
+            ...                       path=["src/", 1])  # type: ignore[list-item] as path expects list[str] and int is provided.
+            Traceback (most recent call last):
+            gitbolt.exceptions.GitExitingException: TypeError: 'path' must be a list of strs
+
             >>> UtilLsTreeArgsValidator().validate("HEAD",
             ...                         z="yes")  # type: ignore[arg-type] as z expects bool and str is provided.
             Traceback (most recent call last):
             gitbolt.exceptions.GitExitingException: TypeError: 'z' must be a boolean
+
+            >>> UtilLsTreeArgsValidator().validate("HEAD",
+            ...                         z=["yes"])  # type: ignore[typeddict-item] as z expects bool and list is provided.
+            Traceback (most recent call last):
+            gitbolt.exceptions.GitExitingException: TypeError: 'z' must be a boolean
         """
         require_type(tree_ish, "tree_ish", str, GitExitingException)
+        if not ls_tree_opts:
+            return
+
+        opts_key = tuple(
+            (key, type(val), val) for key, val in ls_tree_opts.items() if key != "path"
+        )
+        try:
+            hash(opts_key)
+        except TypeError:
+            _validate_ls_tree_opts(ls_tree_opts)
+        else:
+            _validate_ls_tree_opts_once(opts_key)
+
+        path: Any = ls_tree_opts.get("path", _MISSING)
+        if path is not _MISSING:
+            # plain list of plain strs is accepted straight away, anything else goes through the generic check which
+            # also forms the apt error message.
+            if type(path) is list:
+                for _path in path:
+                    if type(_path) is not str:
+                        break
+                else:
+                    return
+            require_iterable(path, "path", str, list, GitExitingException)
+
+
+_MISSING: Final = object()
+"""
+Sentinel telling an option absent from the passed options apart from one passed as ``None``.
+"""
 
-        bool_keys: list[
-            Literal[
-                "d",
-                "r",
-                "t",
-                "long",
-                "z",
-                "name_only",
-                "object_only",
-                "full_name",
-                "full_tree",
-                "name_status",
-            ]
-        ] = [
-            "d",
-            "r",
-            "t",
-            "long",
-            "z",
-            "name_only",
-            "object_only",
-            "full_name",
-            "full_tree",
-            "name_status",
-        ]
-
-        for key in bool_keys:
-            if key in ls_tree_opts:
-                the_key = ls_tree_opts[key]
-                require_type(the_key, key, bool, GitExitingException)
-
-        if "abbrev" in ls_tree_opts:
-            abbrev = ls_tree_opts["abbrev"]
-            require_type(abbrev, "abbrev", int, GitExitingException)
-            if not (0 <= abbrev <= 40):
+_LS_TREE_BOOL_KEYS: Final[frozenset[str]] = frozenset(
+    {
+        "d",
+        "r",
+        "t",
+        "long",
+        "z",
+        "name_only",
+        "object_only",
+        "full_name",
+        "full_tree",
+        "name_status",
+    }
+)
+"""
+``GitLsTreeOpts`` keys that only take a ``bool``.
+"""
+
+
+@lru_cache(maxsize=256)
+def _validate_ls_tree_opts_once(
+    opts_key: tuple[tuple[str, type, Any], ...],
+) -> None:
+    """
+    Validate the ``ls-tree`` options once per distinct set of option values and types, so that bulk callers querying
+    many tree-ishes with the same options do not revalidate them each time. Failed validations are not cached.
+
+    :param opts_key: ``(key, type(value), value)`` of every option except ``path``, which is validated on each call
+        as its contents can change in place. Value types are a part of the key as ``1 == True``.
+
+    >>> _validate_ls_tree_opts_once((("d", bool, True),))
+    >>> _validate_ls_tree_opts_once((("d", int, 1),))
+    Traceback (most recent call last):
+    gitbolt.exceptions.GitExitingException: TypeError: 'd' must be a boolean
+    """
+    _validate_ls_tree_opts(cast(GitLsTreeOpts, {key: val for key, _, val in opts_key}))
+
+
+def _validate_ls_tree_opts(ls_tree_opts: GitLsTreeOpts) -> None:
+    """
+    Validate the ``ls-tree`` options other than ``path`` in a single pass over the passed options, in the order they
+    were passed.
+
+    >>> _validate_ls_tree_opts({"abbrev": 41, "d": "yes"})  # type: ignore[typeddict-item] # d expects bool
+    Traceback (most recent call last):
+    gitbolt.exceptions.GitExitingException: ValueError: abbrev must be between 0 and 40.
+    >>> _validate_ls_tree_opts({"d": "yes", "abbrev": 41})  # type: ignore[typeddict-item] # d expects bool
+    Traceback (most recent call last):
+    gitbolt.exceptions.GitExitingException: TypeError: 'd' must be a boolean
+
+    :param ls_tree_opts: options to validate.
+    :raises GitExitingException: When validation fails.
+    """
+    # values of a TypedDict's items() are typed object, the checks below are what narrow them.
+    opts = cast(dict[str, Any], ls_tree_opts)
+    bool_keys = _LS_TREE_BOOL_KEYS
+    for key, val in opts.items():
+        if key in bool_keys:
+            require_type(val, key, bool, GitExitingException)
+        elif key == "abbrev":
+            # an exact int needs no further type check, anything else goes to require_type which refuses bools and
+            # forms the error message.
+            if type(val) is not int:
+                require_type(val, key, int, GitExitingException)
+            if not (0 <= val <= 40):
                 errmsg = "abbrev must be between 0 and 40."
                 raise GitExitingException(
                     errmsg, exit_code=ERR_INVALID_USAGE
                 ) from ValueError(errmsg)
-
-        if "format_" in ls_tree_opts:
-            format_ = ls_tree_opts["format_"]
-            require_type(format_, "format_", str, GitExitingException)
-
-        if "path" in ls_tree_opts:
-            path = ls_tree_opts["path"]
-            require_iterable(path, "path", str, list, GitExitingException)
+        elif key == "format_":
+            require_type(val, key, str, GitExitingException)
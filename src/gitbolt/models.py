@@ -250,15 +250,42 @@ class GitSSHEnvVars(TypedDict, total=False):
     GIT_SSH_COMMAND: str | Unset
 
 
+GIT_TRACE_TYPE = Literal[0] | bool | Literal[1, 2] | Path | Literal[3, 4, 5, 6, 7, 8, 9]
+"""
+Takes values as declared in https://git-scm.com/docs/git#Documentation/git.txt-codeGITTRACEcode
+"""
+
+
 class GitTraceEnvVars(TypedDict, total=False):
     """
     Env vars mirroring: https://git-scm.com/docs/git#_system
     """
 
-    GIT_TRACE: Literal[1, 2] | bool | Path | Unset
-    GIT_TRACE_SETUP: Literal[1, 2] | bool | Path | Unset
-    GIT_TRACE_PERFORMANCE: Literal[1, 2] | bool | Path | Unset
-    GIT_TRACE_PACKET: Literal[1, 2] | bool | Path | Unset
+    GIT_TRACE: GIT_TRACE_TYPE | Unset
+    """
+    General tracing facility.
+
+    Traces command execution, arguments, and key internal operations.
+    Docs: https://git-scm.com/docs/git#Documentation/git.txt-codeGITTRACEcode
+    """
+
+    GIT_TRACE_SETUP: GIT_TRACE_TYPE | Unset
+    """
+    Traces repository, environment, and config discovery setup.
+    Docs: https://git-scm.com/docs/git#Documentation/git.txt-codeGITTRACESETUPcode
+    """
+
+    GIT_TRACE_PACKET: GIT_TRACE_TYPE | Unset
+    """
+    Traces Git protocol packet communication (push, fetch, etc.).
+    Docs: https://git-scm.com/docs/git#Documentation/git.txt-codeGITTRACEPACKETcode
+    """
+
+    GIT_TRACE_PERFORMANCE: GIT_TRACE_TYPE | Unset
+    """
+    Logs performance data including timing metrics for Git operations.
+    Docs: https://git-scm.com/docs/git#Documentation/git.txt-codeGITTRACEPERFORMANCEcode
+    """
 
 
 class GitConfigEnvVars(TypedDict, total=False):
@@ -295,13 +322,7 @@ class GitNetworkEnvVars(TypedDict, total=False):
     GIT_NO_REPLACE_OBJECTS: Literal[1] | bool | Unset
 
 
-GIT_TRACE_TYPE = Literal[0] | bool | Literal[1, 2] | Path | Literal[3, 4, 5, 6, 7, 8, 9]
-"""
-Takes values as declared in https://git-scm.com/docs/git#Documentation/git.txt-codeGITTRACEcode
-"""
-
-
-class GitLogEnvVars(TypedDict, total=False):
+class GitLogEnvVars(GitTraceEnvVars, total=False):
     """
     Git environment variables related to git's internal debugging, logging, and performance tracing.
 
@@ -312,32 +333,8 @@ class GitLogEnvVars(TypedDict, total=False):
     - `False` or `0`: disabled
     - `True` or 1–9: write trace to stderr
     - `Path`: write trace to file
-    """
-
-    GIT_TRACE: GIT_TRACE_TYPE | Unset
-    """
-    General tracing facility.
-
-    Traces command execution, arguments, and key internal operations.
-    Docs: https://git-scm.com/docs/git#Documentation/git.txt-codeGITTRACEcode
-    """
 
-    GIT_TRACE_SETUP: GIT_TRACE_TYPE | Unset
-    """
-    Traces repository, environment, and config discovery setup.
-    Docs: https://git-scm.com/docs/git#Documentation/git.txt-codeGITTRACESETUPcode
-    """
-
-    GIT_TRACE_PACKET: GIT_TRACE_TYPE | Unset
-    """
-    Traces Git protocol packet communication (push, fetch, etc.).
-    Docs: https://git-scm.com/docs/git#Documentation/git.txt-codeGITTRACEPACKETcode
-    """
-
-    GIT_TRACE_PERFORMANCE: GIT_TRACE_TYPE | Unset
-    """
-    Logs performance data including timing metrics for Git operations.
-    Docs: https://git-scm.com/docs/git#Documentation/git.txt-codeGITTRACEPERFORMANCEcode
+    The general ``GIT_TRACE*`` variables are inherited from ``GitTraceEnvVars``.
     """
 
     GIT_TRACE_PACK_ACCESS: GIT_TRACE_TYPE | Unset
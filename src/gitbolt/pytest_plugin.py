@@ -5,6 +5,7 @@
 Third-party importable pytest plugins for ``gitbolt``.
 """
 
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -14,6 +15,25 @@ REMOTE_DIR_NAME = "remote"
 LOCAL_DIR_NAME = "local"
 
 
+@pytest.fixture(scope="session")
+def repo_template(tmp_path_factory) -> Path:
+    """
+    Create, once per test session, a pristine bare remote repo and its local clone which are then copied for each
+    test by ``repo_remote`` and ``repo_local``. This spares every test the ``git init`` and ``git clone`` subprocess
+    calls.
+
+    :param tmp_path_factory: session-wide temporary directory factory.
+    :return: directory holding the template ``remote`` and ``local`` repos.
+    """
+    template = tmp_path_factory.mktemp("repo-template")
+    for git_args in (
+        ["init", "--bare", REMOTE_DIR_NAME],
+        ["clone", REMOTE_DIR_NAME, LOCAL_DIR_NAME],
+    ):
+        _run_git(git_args, template)
+    return template
+
+
 @pytest.fixture
 def repo_root(tmpdir):
     """
@@ -26,16 +46,35 @@ def repo_root(tmpdir):
 
 
 @pytest.fixture
-def repo_remote(repo_root) -> Path:
-    subprocess.run(
-        ["git", "init", "--bare", REMOTE_DIR_NAME], cwd=repo_root, check=True
-    )
+def repo_remote(repo_root, repo_template) -> Path:
+    shutil.copytree(repo_template / REMOTE_DIR_NAME, repo_root / REMOTE_DIR_NAME)
     return repo_root / REMOTE_DIR_NAME
 
 
 @pytest.fixture
-def repo_local(repo_root, repo_remote) -> Path:
-    subprocess.run(
-        ["git", "clone", REMOTE_DIR_NAME, LOCAL_DIR_NAME], cwd=repo_root, check=True
+def repo_local(repo_root, repo_remote, repo_template) -> Path:
+    shutil.copytree(repo_template / LOCAL_DIR_NAME, repo_root / LOCAL_DIR_NAME)
+    # the template clone records the template remote as its origin, point it to this test's copy.
+    _run_git(
+        ["config", "remote.origin.url", str(repo_remote)],
+        repo_root / LOCAL_DIR_NAME,
     )
     return repo_root / LOCAL_DIR_NAME
+
+
+def _run_git(git_args: list[str], cwd: Path) -> None:
+    """
+    Run a git command for setting up the fixture repos, without any input and output.
+
+    :param git_args: args of the git command, without the leading ``git``.
+    :param cwd: directory to run the git command in.
+    :raises subprocess.CalledProcessError: if the git command fails.
+    """
+    subprocess.run(
+        ["git", *git_args],
+        cwd=cwd,
+        check=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
@@ -7,9 +7,21 @@ Utility functions related to processors specific to git commands.
 
 from __future__ import annotations
 
+from collections.abc import Container, Mapping
+from typing import Any, Final, cast
 
 from gitbolt.models import GitOpts, GitEnvVars
 
+_GIT_OPTS_KEYS: Final[frozenset[str]] = frozenset(GitOpts.__annotations__)
+"""
+Keys of ``GitOpts``, looked up once rather than on every merge.
+"""
+
+_GIT_ENV_VARS_KEYS: Final[frozenset[str]] = frozenset(GitEnvVars.__annotations__)
+"""
+Keys of ``GitEnvVars``, looked up once rather than on every merge.
+"""
+
 
 def merge_git_opts(primary: GitOpts, fallback: GitOpts) -> GitOpts:
     """
@@ -86,7 +98,7 @@ def merge_git_opts(primary: GitOpts, fallback: GitOpts) -> GitOpts:
         fallbacks on the corresponding property from the ``fallback`` ``GitOpts`` object if that corresponding property
         is ``None`` in the ``primary`` ``GitOpts`` object.
     """
-    return merge_typed_dicts(primary, fallback, GitOpts)
+    return cast(GitOpts, _merge_by_keys(primary, fallback, _GIT_OPTS_KEYS))
 
 
 def merge_git_envs(primary: GitEnvVars, fallback: GitEnvVars) -> GitEnvVars:
@@ -164,16 +176,39 @@ def merge_git_envs(primary: GitEnvVars, fallback: GitEnvVars) -> GitEnvVars:
         fallbacks on the corresponding property from the ``fallback`` ``GitEnvVars`` object if that corresponding property
         is explicitly ``None`` in the ``primary`` ``GitEnvVars`` object.
     """
-    return merge_typed_dicts(primary, fallback, GitEnvVars)
+    return cast(GitEnvVars, _merge_by_keys(primary, fallback, _GIT_ENV_VARS_KEYS))
 
 
 # TODO: check for typing this function
 def merge_typed_dicts(primary, fallback, the_typed_dict):
-    merged = {}
-    for k in the_typed_dict.__annotations__.keys():  # type: ignore
-        val = primary.get(k)  # type: ignore # required as mypy thinks k is not str
-        if val is None:
-            val = fallback.get(k)  # type: ignore # required as mypy thinks k is not str
-        if val is not None:
-            merged[k] = val  # type: ignore # required as mypy thinks k is not str
+    return _merge_by_keys(primary, fallback, the_typed_dict.__annotations__)
+
+
+def _merge_by_keys(
+    primary: Mapping[str, Any], fallback: Mapping[str, Any], keys: Container[str]
+) -> dict[str, Any]:
+    """
+    Merge ``primary`` and ``fallback`` over the given ``keys``, taking a value from ``fallback`` where ``primary``
+    has ``None`` and leaving out keys that are ``None`` in both.
+
+    Only the keys actually present in ``primary`` and ``fallback`` are walked, with the ``fallback`` values filled in
+    by ``dict.setdefault()``, so that sparse options are merged without visiting every known key. Merged keys keep
+    the order of ``primary`` followed by the ones only in ``fallback``.
+
+    >>> _merge_by_keys({"a": 1, "b": None}, {"b": 2, "c": None}, ("a", "b", "c"))
+    {'a': 1, 'b': 2}
+    >>> _merge_by_keys({"a": False, "b": None}, {}, ("a", "b", "c"))
+    {'a': False}
+    >>> _merge_by_keys({}, {"a": 0, "b": None}, ("a", "b", "c"))
+    {'a': 0}
+    >>> _merge_by_keys({"a": 1, "z": 2}, {"b": 3, "y": 4}, ("a", "b"))
+    {'a': 1, 'b': 3}
+    >>> _merge_by_keys({"b": None, "a": 1}, {"c": 3, "b": 2}, ("a", "b", "c"))
+    {'a': 1, 'c': 3, 'b': 2}
+    """
+    merged = {k: v for k, v in primary.items() if v is not None and k in keys}
+    setdefault = merged.setdefault
+    for k, v in fallback.items():
+        if v is not None and k in keys:
+            setdefault(k, v)
     return merged
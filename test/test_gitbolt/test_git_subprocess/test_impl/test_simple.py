@@ -3,8 +3,14 @@
 
 """
 Tests for Git command interfaces with default implementation using subprocess calls.
+
+Every test builds its own git command (see the ``git`` fixture) and module level values are only read, so these tests
+can run in any order and in parallel, e.g. ``pytest -n auto``.
 """
 
+import asyncio
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -12,8 +18,103 @@ from vt.utils.commons.commons.core_py import UNSET
 from vt.utils.errors.error_specs import ERR_DATA_FORMAT_ERR, ERR_INVALID_USAGE
 
 from gitbolt.exceptions import GitExitingException
+from gitbolt.git_subprocess import VersionCommand
 from gitbolt.git_subprocess.exceptions import GitCmdException
-from gitbolt.git_subprocess.impl.simple import SimpleGitCommand, CLISimpleGitCommand
+from gitbolt.git_subprocess.add import IndividuallyOverridableACAB
+from gitbolt.git_subprocess.impl.simple import (
+    SimpleGitCommand,
+    CLISimpleGitCommand,
+    LsTreeCommandImpl,
+    AddCommandImpl,
+    VersionCommandImpl,
+    GitSubcmdCommandImpl,
+)
+from gitbolt.git_subprocess.ls_tree import IndividuallyOverridableLTCAB
+from gitbolt.git_subprocess.runner import GitCommandRunner
+from gitbolt.git_subprocess.runner.caching_impl import CachingGitCR
+from gitbolt.git_subprocess.runner.simple_impl import SimpleGitCR
+from gitbolt.git_subprocess.utils import gather_git
+
+
+# values shared by the override tests, the overrides only read them so they are built once.
+TMP_DIR = Path("tmp")
+CUR_DIR = Path()
+GIT_DIR_PATH = Path("/tmp/git-dir")
+CUR_DIR_STR = str(CUR_DIR)
+TMP_EXEC_DIR_STR = str(Path("tmp", "exec"))
+GIT_DIR_PATH_STR = str(GIT_DIR_PATH)
+SSH_PATH = Path("/tmp/SSH")
+SSH_PATH_STR = str(SSH_PATH)
+ALTER_DIR = Path("/tmp/alter")
+ALTER_DIR_STR = str(ALTER_DIR)
+DOT_GIT_DIR = Path("/tmp/git-dir/.git")
+OBJ_DIR = Path("/tmp/obj-dir/")
+CONFIG_ENV = {"auth": "suhas", "comm": "suyog"}
+# identity for the test commits, supplied as ``-c`` main opts instead of ``git config`` runs.
+COMMITTER_CONFIG = {"user.name": "suhas", "user.email": "suhas@example.com"}
+
+# ``input_dict, expected`` cases for ``_main_cmd_small_c_args()``.
+SMALL_C_CASES = (
+    pytest.param({"foo.bar": "baz"}, ["-c", "foo.bar=baz"], id="key-value"),
+    pytest.param({"foo.bar": ""}, ["-c", "foo.bar="], id="empty-str"),
+    # no equals sign
+    pytest.param({"foo.bar": True}, ["-c", "foo.bar"], id="true"),
+    # explicit empty string
+    pytest.param({"foo.bar": False}, ["-c", "foo.bar="], id="false"),
+    # treated as True
+    pytest.param({"foo.bar": None}, ["-c", "foo.bar"], id="none"),
+    pytest.param(
+        {"a.b": "x", "c.d": "", "e.f": True, "g.h": False, "i.j": None},
+        ["-c", "a.b=x", "-c", "c.d=", "-c", "e.f", "-c", "g.h=", "-c", "i.j"],
+        id="mixed",
+    ),
+    pytest.param({}, [], id="empty-config"),
+    pytest.param(None, [], id="c-none"),
+    pytest.param(UNSET, [], id="c-unset"),
+    # UNSET removes the key
+    pytest.param(
+        {"foo.bar": "value", "bar.baz": UNSET}, ["-c", "foo.bar=value"], id="unset-key"
+    ),
+    pytest.param({"foo.bar": UNSET}, [], id="all-unset"),
+    pytest.param(
+        {"a.b": UNSET, "b.c": True, "c.d": False},
+        ["-c", "b.c", "-c", "c.d="],
+        id="mixed-unset",
+    ),
+)
+
+
+# ``build, expected`` cases where the env overrides are chained before or after a main opts override.
+MAIN_OPT_MIXED_CASES = (
+    pytest.param(
+        lambda git: git.git_envs_override(GIT_TRACE=True).git_opts_override(
+            no_pager=True
+        ),
+        {"GIT_TRACE": "True"},
+        id="one-supplied-main-opts-last-call",
+    ),
+    pytest.param(
+        lambda git: git.git_opts_override(no_pager=True).git_envs_override(
+            GIT_TRACE=True
+        ),
+        {"GIT_TRACE": "True"},
+        id="one-supplied-main-opts-non-last-call",
+    ),
+    pytest.param(
+        lambda git: git.git_opts_override(no_advice=True).git_envs_override(
+            GIT_TRACE=1, GIT_DIR=GIT_DIR_PATH, GIT_EDITOR="vim"
+        ),
+        {"GIT_TRACE": "1", "GIT_DIR": GIT_DIR_PATH_STR, "GIT_EDITOR": "vim"},
+        id="multiple-supplied-main-opts-first",
+    ),
+    pytest.param(
+        lambda git: git.git_envs_override(
+            GIT_TRACE=1, GIT_DIR=GIT_DIR_PATH, GIT_EDITOR="vim"
+        ).git_opts_override(no_advice=True),
+        {"GIT_TRACE": "1", "GIT_DIR": GIT_DIR_PATH_STR, "GIT_EDITOR": "vim"},
+        id="multiple-supplied-main-opts-last",
+    ),
+)
 
 
 def test_exec_path():
@@ -26,7 +127,27 @@ def test_overrides_and_exec_path():
     assert git.git_opts_override(exec_path=None).exec_path() is not None
 
 
-@pytest.mark.parametrize("git", [SimpleGitCommand(), CLISimpleGitCommand()])
+def test_false_flag_opts_are_not_emitted():
+    git = SimpleGitCommand()
+    assert (
+        git.git_opts_override(
+            paginate=False, no_pager=False, bare=False, no_advice=False
+        ).build_main_cmd_args()
+        == []
+    )
+    assert git.git_opts_override(
+        paginate=True, no_advice=False
+    ).build_main_cmd_args() == ["--paginate"]
+
+
+@pytest.fixture(params=[SimpleGitCommand, CLISimpleGitCommand], ids=["simple", "cli"])
+def git(request):
+    """
+    A fresh git command of each kind for every test so that no state can bleed from one test into another.
+    """
+    return request.param()
+
+
 class TestMainGit:
     class TestMainCmdOverrides:
         class TestSupplied:
@@ -38,7 +159,7 @@ class TestMainGit:
 
                 def test_multiple_supplied(self, git):
                     assert git.git_opts_override(
-                        no_replace_objects=True, git_dir=Path(), paginate=True
+                        no_replace_objects=True, git_dir=CUR_DIR, paginate=True
                     ).build_main_cmd_args() == [
                         "--paginate",
                         "--git-dir",
@@ -49,7 +170,7 @@ class TestMainGit:
         class TestMultipleCalls:
             def test_one_supplied(self, git):
                 assert git.git_opts_override().git_opts_override(
-                    exec_path=Path("tmp")
+                    exec_path=TMP_DIR
                 ).git_opts_override(noglob_pathspecs=True).build_main_cmd_args() == [
                     "--exec-path",
                     "tmp",
@@ -57,11 +178,9 @@ class TestMainGit:
                 ]
 
             def test_multiple_supplied(self, git):
-                assert git.git_opts_override(exec_path=Path("tmp")).git_opts_override(
+                assert git.git_opts_override(exec_path=TMP_DIR).git_opts_override(
                     noglob_pathspecs=True, no_advice=True
-                ).git_opts_override(
-                    config_env={"auth": "suhas", "comm": "suyog"}
-                ).build_main_cmd_args() == [
+                ).git_opts_override(config_env=CONFIG_ENV).build_main_cmd_args() == [
                     "--config-env",
                     "auth=suhas",
                     "--config-env",
@@ -78,7 +197,7 @@ class TestMainGit:
                 only --exec-path is set in first ``git_opts_override()`` call and is unset in next ``git_opts_override()`` call.
                 """
                 assert (
-                    git.git_opts_override(exec_path=Path("tmp"))
+                    git.git_opts_override(exec_path=TMP_DIR)
                     .git_opts_override(exec_path=UNSET)
                     .build_main_cmd_args()
                     == []
@@ -89,160 +208,57 @@ class TestMainGit:
                 -C and --exec-path is set in first ``git_opts_override()`` call and is unset in next ``git_opts_override()`` call.
                 """
                 assert git.git_opts_override(
-                    exec_path=Path("tmp"), C=[Path()]
+                    exec_path=TMP_DIR, C=[CUR_DIR]
                 ).git_opts_override(exec_path=UNSET).build_main_cmd_args() == [
                     "-C",
                     ".",
                 ]
 
             class TestMultipleCalls:
-                def test_unset_value_on_last_call(self, git):
-                    """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in last ``git_opts_override()`` call.
-                    """
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(exec_path=UNSET).build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                    ]
-
-                def test_unset_value_on_non_last_call(self, git):
-                    """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in next ``git_opts_override()`` call.
-                    * --no-replace-objects is set in last ``git_opts_override()`` call.
-                    """
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(exec_path=UNSET).git_opts_override(
-                        no_replace_objects=True
-                    ).build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                        "--no-replace-objects",
-                    ]
-
-                def test_no_value_on_non_last_call(self, git):
-                    """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in next ``git_opts_override()`` call.
-                    * no value given to last ``git_opts_override()`` call.
-                    """
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(
-                        exec_path=UNSET
-                    ).git_opts_override().build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                    ]
-
-                def test_re_set_value_on_non_last_call(self, git):
+                @pytest.mark.parametrize(
+                    "last_call_opts, last_call_expected",
+                    [
+                        pytest.param(None, [], id="unset-on-last-call"),
+                        pytest.param(
+                            {"no_replace_objects": True},
+                            ["--no-replace-objects"],
+                            id="unset-on-non-last-call",
+                        ),
+                        pytest.param({}, [], id="no-value-on-non-last-call"),
+                        pytest.param(
+                            {"exec_path": CUR_DIR},
+                            ["--exec-path", "."],
+                            id="re-set-on-non-last-call",
+                        ),
+                    ],
+                )
+                def test_unset_value(self, git, last_call_opts, last_call_expected):
                     """
                     * -C and --exec-path is set in first ``git_opts_override()`` call.
                     * --config-env is set in the next ``git_opts_override()`` call.
                     * --exec-path is unset in next ``git_opts_override()`` call.
-                    * --no-replace-objects is set in last ``git_opts_override()`` call.
+                    * ``last_call_opts``, if any, are given to the last ``git_opts_override()`` call.
                     """
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(exec_path=UNSET).git_opts_override(
-                        exec_path=Path()
-                    ).build_main_cmd_args() == [
+                    git = (
+                        git.git_opts_override(exec_path=TMP_DIR, C=[CUR_DIR])
+                        .git_opts_override(config_env=CONFIG_ENV)
+                        .git_opts_override(exec_path=UNSET)
+                    )
+                    if last_call_opts is not None:
+                        git = git.git_opts_override(**last_call_opts)
+                    assert git.build_main_cmd_args() == [
                         "-C",
                         ".",
                         "--config-env",
                         "auth=suhas",
                         "--config-env",
                         "comm=suyog",
-                        "--exec-path",
-                        ".",
+                        *last_call_expected,
                     ]
 
         class TestIndividualMethods:
             class TestSmallC:
-                @pytest.mark.parametrize(
-                    "input_dict,expected",
-                    [
-                        # Simple key-value
-                        ({"foo.bar": "baz"}, ["-c", "foo.bar=baz"]),
-                        # Empty string value
-                        ({"foo.bar": ""}, ["-c", "foo.bar="]),
-                        # Boolean True (no equals sign)
-                        ({"foo.bar": True}, ["-c", "foo.bar"]),
-                        # Boolean False (explicit empty string)
-                        ({"foo.bar": False}, ["-c", "foo.bar="]),
-                        # None (treated as True)
-                        ({"foo.bar": None}, ["-c", "foo.bar"]),
-                        # Mixed values
-                        (
-                            {
-                                "a.b": "x",
-                                "c.d": "",
-                                "e.f": True,
-                                "g.h": False,
-                                "i.j": None,
-                            },
-                            [
-                                "-c",
-                                "a.b=x",
-                                "-c",
-                                "c.d=",
-                                "-c",
-                                "e.f",
-                                "-c",
-                                "g.h=",
-                                "-c",
-                                "i.j",
-                            ],
-                        ),
-                        # Empty config (no args)
-                        ({}, []),
-                        # c is None
-                        (None, []),
-                        # c is UNSET
-                        (UNSET, []),
-                        # Missing key
-                        ({}, []),
-                        # UNSET should remove the key
-                        (
-                            {"foo.bar": "value", "bar.baz": UNSET},
-                            ["-c", "foo.bar=value"],
-                        ),
-                        # All keys are unset
-                        ({"foo.bar": UNSET}, []),
-                        # Mixed unset, true, false
-                        (
-                            {"a.b": UNSET, "b.c": True, "c.d": False},
-                            ["-c", "b.c", "-c", "c.d="],
-                        ),
-                    ],
-                )
+                @pytest.mark.parametrize("input_dict,expected", SMALL_C_CASES)
                 def test_main_cmd_c_args(self, git, input_dict, expected):
                     git = git.git_opts_override(c=input_dict)
                     assert git._main_cmd_small_c_args() == expected
@@ -257,41 +273,17 @@ class TestMainGit:
 
                 def test_multiple_supplied(self, git):
                     assert git.git_envs_override(
-                        GIT_TRACE=1, GIT_DIR=Path("/tmp/git-dir/"), GIT_EDITOR="vim"
+                        GIT_TRACE=1, GIT_DIR=GIT_DIR_PATH, GIT_EDITOR="vim"
                     ).build_git_envs() == {
                         "GIT_TRACE": "1",
-                        "GIT_DIR": str(Path("/tmp/git-dir")),
+                        "GIT_DIR": GIT_DIR_PATH_STR,
                         "GIT_EDITOR": "vim",
                     }
 
                 class TestMainOptMixed:
-                    def test_one_supplied_main_opts_last_call(self, git):
-                        assert git.git_envs_override(GIT_TRACE=True).git_opts_override(
-                            no_pager=True
-                        ).build_git_envs() == {"GIT_TRACE": "True"}
-
-                    def test_one_supplied_main_opts_non_last_call(self, git):
-                        assert git.git_opts_override(no_pager=True).git_envs_override(
-                            GIT_TRACE=True
-                        ).build_git_envs() == {"GIT_TRACE": "True"}
-
-                    def test_multiple_supplied_main_opts_first(self, git):
-                        assert git.git_opts_override(no_advice=True).git_envs_override(
-                            GIT_TRACE=1, GIT_DIR=Path("/tmp/git-dir/"), GIT_EDITOR="vim"
-                        ).build_git_envs() == {
-                            "GIT_TRACE": "1",
-                            "GIT_DIR": str(Path("/tmp/git-dir")),
-                            "GIT_EDITOR": "vim",
-                        }
-
-                    def test_multiple_supplied_main_opts_last(self, git):
-                        assert git.git_envs_override(
-                            GIT_TRACE=1, GIT_DIR=Path("/tmp/git-dir/"), GIT_EDITOR="vim"
-                        ).git_opts_override(no_advice=True).build_git_envs() == {
-                            "GIT_TRACE": "1",
-                            "GIT_DIR": str(Path("/tmp/git-dir")),
-                            "GIT_EDITOR": "vim",
-                        }
+                    @pytest.mark.parametrize("build, expected", MAIN_OPT_MIXED_CASES)
+                    def test_main_opts_order(self, git, build, expected):
+                        assert build(git).build_git_envs() == expected
 
         class TestMultipleCalls:
             def test_one_supplied(self, git):
@@ -308,17 +300,15 @@ class TestMainGit:
                 }
 
             def test_multiple_supplied(self, git):
-                assert git.git_envs_override(
-                    GIT_SSH=Path("/tmp/SSH")
-                ).git_envs_override(
+                assert git.git_envs_override(GIT_SSH=SSH_PATH).git_envs_override(
                     GIT_TERMINAL_PROMPT=1, GIT_NO_REPLACE_OBJECTS=True
                 ).git_envs_override(
-                    GIT_ALTERNATE_OBJECT_DIRECTORIES=Path("/tmp/alter")
+                    GIT_ALTERNATE_OBJECT_DIRECTORIES=ALTER_DIR
                 ).build_git_envs() == {
-                    "GIT_SSH": str(Path("/tmp/SSH")),
+                    "GIT_SSH": SSH_PATH_STR,
                     "GIT_TERMINAL_PROMPT": "1",
                     "GIT_NO_REPLACE_OBJECTS": "True",
-                    "GIT_ALTERNATE_OBJECT_DIRECTORIES": str(Path("/tmp/alter")),
+                    "GIT_ALTERNATE_OBJECT_DIRECTORIES": ALTER_DIR_STR,
                 }
 
             class TestMainOptsMixed:
@@ -335,7 +325,7 @@ class TestMainGit:
 
                 def test_one_supplied_more_calls(self, git):
                     assert git.git_envs_override().git_opts_override(
-                        exec_path=Path("/tmp/git-dir")
+                        exec_path=GIT_DIR_PATH
                     ).git_envs_override(GIT_TRACE_SETUP=2).git_envs_override(
                         GIT_ADVICE=False
                     ).git_opts_override(
@@ -346,19 +336,17 @@ class TestMainGit:
                     }
 
                 def test_multiple_supplied(self, git):
-                    assert git.git_envs_override(
-                        GIT_SSH=Path("/tmp/SSH")
-                    ).git_opts_override(
-                        exec_path=Path("/tmp/git-dir")
+                    assert git.git_envs_override(GIT_SSH=SSH_PATH).git_opts_override(
+                        exec_path=GIT_DIR_PATH
                     ).git_envs_override(
                         GIT_TERMINAL_PROMPT=1, GIT_NO_REPLACE_OBJECTS=True
                     ).git_envs_override(
-                        GIT_ALTERNATE_OBJECT_DIRECTORIES=Path("/tmp/alter")
+                        GIT_ALTERNATE_OBJECT_DIRECTORIES=ALTER_DIR
                     ).build_git_envs() == {
-                        "GIT_SSH": str(Path("/tmp/SSH")),
+                        "GIT_SSH": SSH_PATH_STR,
                         "GIT_TERMINAL_PROMPT": "1",
                         "GIT_NO_REPLACE_OBJECTS": "True",
-                        "GIT_ALTERNATE_OBJECT_DIRECTORIES": str(Path("/tmp/alter")),
+                        "GIT_ALTERNATE_OBJECT_DIRECTORIES": ALTER_DIR_STR,
                     }
 
         class TestOverrideValues:
@@ -367,7 +355,7 @@ class TestMainGit:
                 only GIT_DIR is set in first ``git_envs_override()`` call and is unset in next ``git_envs_override()`` call.
                 """
                 assert (
-                    git.git_envs_override(GIT_DIR=Path("tmp"))
+                    git.git_envs_override(GIT_DIR=TMP_DIR)
                     .git_envs_override(GIT_DIR=UNSET)
                     .build_git_envs()
                     == {}
@@ -378,7 +366,7 @@ class TestMainGit:
                 GIT_DIR and GIT_ADVICE is set in first ``git_envs_override()`` call and is unset in next ``git_envs_override()`` call.
                 """
                 assert git.git_envs_override(
-                    GIT_DIR=Path("tmp"), GIT_TRACE=2, GIT_ADVICE=0
+                    GIT_DIR=TMP_DIR, GIT_TRACE=2, GIT_ADVICE=0
                 ).git_envs_override(GIT_DIR=UNSET).build_git_envs() == {
                     "GIT_TRACE": "2",
                     "GIT_ADVICE": "0",
@@ -387,154 +375,47 @@ class TestMainGit:
             class TestMultipleCalls:
                 def test_unset_value_on_last_call(self, git):
                     """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in last ``git_opts_override()`` call.
-                    """
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(exec_path=UNSET).build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                    ]
-
-                def test_unset_value_on_non_last_call(self, git):
-                    """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in next ``git_opts_override()`` call.
-                    * --no-replace-objects is set in last ``git_opts_override()`` call.
+                    * GIT_DIR and GIT_TRACE is set in first ``git_envs_override()`` call.
+                    * GIT_EDITOR is set in the next ``git_envs_override()`` call.
+                    * GIT_DIR is unset in last ``git_envs_override()`` call.
                     """
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(exec_path=UNSET).git_opts_override(
-                        no_replace_objects=True
-                    ).build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                        "--no-replace-objects",
-                    ]
+                    assert git.git_envs_override(
+                        GIT_DIR=TMP_DIR, GIT_TRACE=2
+                    ).git_envs_override(GIT_EDITOR="vim").git_envs_override(
+                        GIT_DIR=UNSET
+                    ).build_git_envs() == {"GIT_TRACE": "2", "GIT_EDITOR": "vim"}
 
-                def test_no_value_on_non_last_call(self, git):
+                def test_unset_value_on_non_last_call_with_opts_mixed(self, git):
                     """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in next ``git_opts_override()`` call.
-                    * no value given to last ``git_opts_override()`` call.
+                    * GIT_DIR and GIT_TRACE is set in first ``git_envs_override()`` call.
+                    * --exec-path is set in the next ``git_opts_override()`` call.
+                    * GIT_DIR is unset in next ``git_envs_override()`` call.
+                    * GIT_ADVICE is set in last ``git_envs_override()`` call.
                     """
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(
-                        exec_path=UNSET
-                    ).git_opts_override().build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                    ]
+                    git = (
+                        git.git_envs_override(GIT_DIR=TMP_DIR, GIT_TRACE=2)
+                        .git_opts_override(exec_path=TMP_DIR)
+                        .git_envs_override(GIT_DIR=UNSET)
+                        .git_envs_override(GIT_ADVICE=0)
+                    )
+                    assert git.build_git_envs() == {"GIT_TRACE": "2", "GIT_ADVICE": "0"}
+                    assert git.build_main_cmd_args() == ["--exec-path", "tmp"]
 
                 def test_re_set_value_on_non_last_call(self, git):
                     """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in next ``git_opts_override()`` call.
-                    * --no-replace-objects is set in last ``git_opts_override()`` call.
+                    * GIT_DIR and GIT_TRACE is set in first ``git_envs_override()`` call.
+                    * GIT_DIR is unset in next ``git_envs_override()`` call.
+                    * GIT_DIR is set again in next ``git_envs_override()`` call.
+                    * no value given to last ``git_envs_override()`` call.
                     """
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(exec_path=UNSET).git_opts_override(
-                        exec_path=Path()
-                    ).build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                        "--exec-path",
-                        ".",
-                    ]
-
-        class TestIndividualMethods:
-            class TestSmallC:
-                @pytest.mark.parametrize(
-                    "input_dict,expected",
-                    [
-                        # Simple key-value
-                        ({"foo.bar": "baz"}, ["-c", "foo.bar=baz"]),
-                        # Empty string value
-                        ({"foo.bar": ""}, ["-c", "foo.bar="]),
-                        # Boolean True (no equals sign)
-                        ({"foo.bar": True}, ["-c", "foo.bar"]),
-                        # Boolean False (explicit empty string)
-                        ({"foo.bar": False}, ["-c", "foo.bar="]),
-                        # None (treated as True)
-                        ({"foo.bar": None}, ["-c", "foo.bar"]),
-                        # Mixed values
-                        (
-                            {
-                                "a.b": "x",
-                                "c.d": "",
-                                "e.f": True,
-                                "g.h": False,
-                                "i.j": None,
-                            },
-                            [
-                                "-c",
-                                "a.b=x",
-                                "-c",
-                                "c.d=",
-                                "-c",
-                                "e.f",
-                                "-c",
-                                "g.h=",
-                                "-c",
-                                "i.j",
-                            ],
-                        ),
-                        # Empty config (no args)
-                        ({}, []),
-                        # c is None
-                        (None, []),
-                        # c is UNSET
-                        (UNSET, []),
-                        # Missing key
-                        ({}, []),
-                        # UNSET should remove the key
-                        (
-                            {"foo.bar": "value", "bar.baz": UNSET},
-                            ["-c", "foo.bar=value"],
-                        ),
-                        # All keys are unset
-                        ({"foo.bar": UNSET}, []),
-                        # Mixed unset, true, false
-                        (
-                            {"a.b": UNSET, "b.c": True, "c.d": False},
-                            ["-c", "b.c", "-c", "c.d="],
-                        ),
-                    ],
-                )
-                def test_main_cmd_c_args(self, git, input_dict, expected):
-                    git = git.git_opts_override(c=input_dict)
-                    assert git._main_cmd_small_c_args() == expected
+                    assert git.git_envs_override(
+                        GIT_DIR=TMP_DIR, GIT_TRACE=2
+                    ).git_envs_override(GIT_DIR=UNSET).git_envs_override(
+                        GIT_DIR=Path("git-dir")
+                    ).git_envs_override().build_git_envs() == {
+                        "GIT_TRACE": "2",
+                        "GIT_DIR": "git-dir",
+                    }
 
     class TestOptsEnvMixedOverrides:
         class TestNoOverrides:
@@ -553,19 +434,19 @@ class TestMainGit:
             class TestEnvs:
                 def test_once(self, git):
                     envs_o_git = git.git_envs_override(
-                        GIT_AUTHOR_NAME="ss", GIT_OBJECT_DIRECTORY=Path("/tmp/obj-dir/")
+                        GIT_AUTHOR_NAME="ss", GIT_OBJECT_DIRECTORY=OBJ_DIR
                     )
                     assert (
                         git._env_vars is None
                     )  # parent ``git`` object protected properties still empty.
                     assert envs_o_git._env_vars == {
                         "GIT_AUTHOR_NAME": "ss",
-                        "GIT_OBJECT_DIRECTORY": Path("/tmp/obj-dir/"),
+                        "GIT_OBJECT_DIRECTORY": OBJ_DIR,
                     }
 
                 def test_twice(self, git):
                     envs_o_git = git.git_envs_override(
-                        GIT_AUTHOR_NAME="ss", GIT_OBJECT_DIRECTORY=Path("/tmp/obj-dir/")
+                        GIT_AUTHOR_NAME="ss", GIT_OBJECT_DIRECTORY=OBJ_DIR
                     )
                     envs_o_o_git = envs_o_git.git_envs_override(GIT_SSH_COMMAND="gpg")
                     assert (
@@ -573,30 +454,30 @@ class TestMainGit:
                     )  # ancestor ``git`` object protected properties still empty.
                     assert envs_o_git._env_vars == {
                         "GIT_AUTHOR_NAME": "ss",
-                        "GIT_OBJECT_DIRECTORY": Path("/tmp/obj-dir/"),
+                        "GIT_OBJECT_DIRECTORY": OBJ_DIR,
                     }  # parent git protected properties still not overridden
                     assert envs_o_o_git._env_vars == {
                         "GIT_AUTHOR_NAME": "ss",
-                        "GIT_OBJECT_DIRECTORY": Path("/tmp/obj-dir/"),
+                        "GIT_OBJECT_DIRECTORY": OBJ_DIR,
                         "GIT_SSH_COMMAND": "gpg",
                     }  # new property added in child object
 
             class TestOpts:
                 def test_once(self, git):
                     main_o_git = git.git_opts_override(
-                        namespace="ss", git_dir=Path("/tmp/git-dir/.git")
+                        namespace="ss", git_dir=DOT_GIT_DIR
                     )
                     assert (
                         git._main_cmd_opts == {}
                     )  # parent ``git`` object protected properties still empty.
                     assert main_o_git._main_cmd_opts == {
                         "namespace": "ss",
-                        "git_dir": Path("/tmp/git-dir/.git"),
+                        "git_dir": DOT_GIT_DIR,
                     }
 
                 def test_twice(self, git):
                     main_o_git = git.git_opts_override(
-                        namespace="ss", git_dir=Path("/tmp/git-dir/.git")
+                        namespace="ss", git_dir=DOT_GIT_DIR
                     )
                     main_o_o_git = main_o_git.git_opts_override(paginate=True)
                     assert (
@@ -604,18 +485,18 @@ class TestMainGit:
                     )  # ancestor ``git`` object protected properties still empty.
                     assert main_o_git._main_cmd_opts == {
                         "namespace": "ss",
-                        "git_dir": Path("/tmp/git-dir/.git"),
+                        "git_dir": DOT_GIT_DIR,
                     }  # parent git protected properties still not overridden
                     assert main_o_o_git._main_cmd_opts == {
                         "namespace": "ss",
-                        "git_dir": Path("/tmp/git-dir/.git"),
+                        "git_dir": DOT_GIT_DIR,
                         "paginate": True,
                     }  # new property added in child object
 
         class TestOverridingOneDoesNotAffectOther:
             def test_override_envs(self, git):
                 envs_o_git = git.git_envs_override(
-                    GIT_AUTHOR_NAME="ss", GIT_OBJECT_DIRECTORY=Path("/tmp/obj-dir/")
+                    GIT_AUTHOR_NAME="ss", GIT_OBJECT_DIRECTORY=OBJ_DIR
                 )
                 assert (
                     git._main_cmd_opts == {}
@@ -625,9 +506,7 @@ class TestMainGit:
                 )  # overriding envs didn't override main-opts
 
             def test_override_opts(self, git):
-                main_o_git = git.git_opts_override(
-                    namespace="ss", git_dir=Path("/tmp/git-dir/.git")
-                )
+                main_o_git = git.git_opts_override(namespace="ss", git_dir=DOT_GIT_DIR)
                 assert (
                     git._env_vars is None
                 )  # overriding opts didn't override envs in parent
@@ -641,9 +520,9 @@ def _adjust_opts(
     opts: list[str], prefer_overriding: bool, overriding_opts: list[str]
 ) -> list[str]:
     """
-    Position ``overriding_opts`` after ``opts`` in the returned list when prefer_overriding is ``True``.
+    Position ``overriding_opts`` before ``opts`` in the returned list when prefer_overriding is ``True``.
 
-    Position ``overriding_opts`` before ``opts`` in the returned list when prefer_overriding is ``False``.
+    Position ``overriding_opts`` after ``opts`` in the returned list when prefer_overriding is ``False``.
 
     >>> _adjust_opts(["a", "b"], True, ["c", "d"])
     ['c', 'd', 'a', 'b']
@@ -651,16 +530,32 @@ def _adjust_opts(
     >>> _adjust_opts(["a", "b"], False, ["c", "d"])
     ['a', 'b', 'c', 'd']
 
+    Neither of the supplied lists is changed:
+
+    >>> _opts = ["a", "b"]
+    >>> _overriding_opts = ["c", "d"]
+    >>> _adjust_opts(_opts, False, _overriding_opts) is _opts
+    False
+    >>> _adjust_opts(_opts, True, _overriding_opts) is _overriding_opts
+    False
+    >>> _opts, _overriding_opts
+    (['a', 'b'], ['c', 'd'])
+
     :param opts: options to adjust according to ``prefer_cli``.
-    :param prefer_overriding: positions ``overriding_opts`` after (when ``True``) or before (when ``False``) ``opts``.
+    :param prefer_overriding: positions ``overriding_opts`` before (when ``True``) or after (when ``False``) ``opts``.
     :param overriding_opts: options that will be positioned before or after ``opts``.
     :returns: options with appropriate ordering of ``opts`` and ``overriding_opts`` according to ``prefer_cli``.
     """
-    if prefer_overriding:
-        opts = overriding_opts + opts
-    else:
-        opts.extend(overriding_opts)
-    return opts
+    return overriding_opts + opts if prefer_overriding else opts + overriding_opts
+
+
+@pytest.fixture
+def opts(request) -> list[str]:
+    """
+    A fresh list of the parametrized (as a tuple) cli opts for every test so that no test can alter the opts of
+    another.
+    """
+    return list(request.param)
 
 
 # TODO: complete all the test cases for CLISimpleGitCommand
@@ -751,28 +646,29 @@ class TestMainCLIGit:
         @pytest.mark.parametrize(
             "opts",
             [
-                [],
-                ["--no-replace-objects"],
-                ["--paginate", "--git-dir", ".", "--no-replace-objects"],
-                ["-c", "p1=v1", "-c", "p2=v2"],
+                (),
+                ("--no-replace-objects",),
+                ("--paginate", "--git-dir", ".", "--no-replace-objects"),
+                ("-c", "p1=v1", "-c", "p2=v2"),
             ],
+            indirect=True,
         )
         @pytest.mark.parametrize("prefer_cli", [True, False])
         class TestNonOverriding:
             class TestSingleCall:
                 def test_single_supplied(self, opts: list[str], prefer_cli: bool):
                     git = CLISimpleGitCommand(
-                        opts=opts.copy(), prefer_cli=prefer_cli
-                    ).git_opts_override(C=[Path()])
-                    overriding_opts = ["-C", str(Path())]
+                        opts=opts, prefer_cli=prefer_cli
+                    ).git_opts_override(C=[CUR_DIR])
+                    overriding_opts = ["-C", CUR_DIR_STR]
                     opts = _adjust_opts(opts, prefer_cli, overriding_opts)
                     assert git.build_main_cmd_args() == opts
 
                 def test_multiple_supplied(self, opts: list[str], prefer_cli: bool):
                     git = CLISimpleGitCommand(
-                        opts=opts.copy(), prefer_cli=prefer_cli
+                        opts=opts, prefer_cli=prefer_cli
                     ).git_opts_override(
-                        namespace="n1", exec_path=Path(), c=dict(p3="v3", p4="v4v5")
+                        namespace="n1", exec_path=CUR_DIR, c={"p3": "v3", "p4": "v4v5"}
                     )
                     overriding_opts = [
                         "-c",
@@ -789,7 +685,7 @@ class TestMainCLIGit:
 
             class TestMultipleCalls:
                 def test_one_supplied(self, opts: list[str], prefer_cli: bool):
-                    git = CLISimpleGitCommand(opts=opts.copy(), prefer_cli=prefer_cli)
+                    git = CLISimpleGitCommand(opts=opts, prefer_cli=prefer_cli)
                     overriding_opts = [
                         "--exec-path",
                         "tmp",
@@ -798,14 +694,14 @@ class TestMainCLIGit:
                     opts = _adjust_opts(opts, prefer_cli, overriding_opts)
                     assert (
                         git.git_opts_override()
-                        .git_opts_override(exec_path=Path("tmp"))
+                        .git_opts_override(exec_path=TMP_DIR)
                         .git_opts_override(noglob_pathspecs=True)
                         .build_main_cmd_args()
                         == opts
                     )
 
                 def test_multiple_supplied(self, opts: list[str], prefer_cli: bool):
-                    git = CLISimpleGitCommand(opts=opts.copy(), prefer_cli=prefer_cli)
+                    git = CLISimpleGitCommand(opts=opts, prefer_cli=prefer_cli)
                     overriding_opts = [
                         "--config-env",
                         "auth=suhas",
@@ -818,17 +714,15 @@ class TestMainCLIGit:
                     ]
                     opts = _adjust_opts(opts, prefer_cli, overriding_opts)
                     assert (
-                        git.git_opts_override(exec_path=Path("tmp"))
+                        git.git_opts_override(exec_path=TMP_DIR)
                         .git_opts_override(noglob_pathspecs=True, no_advice=True)
-                        .git_opts_override(
-                            config_env={"auth": "suhas", "comm": "suyog"}
-                        )
+                        .git_opts_override(config_env=CONFIG_ENV)
                         .build_main_cmd_args()
                         == opts
                     )
 
             def test_intermixed(self, opts: list[str], prefer_cli: bool):
-                git = CLISimpleGitCommand(opts=opts.copy(), prefer_cli=prefer_cli)
+                git = CLISimpleGitCommand(opts=opts, prefer_cli=prefer_cli)
                 overriding_opts = [
                     "--config-env",
                     "auth=suhas",
@@ -842,9 +736,9 @@ class TestMainCLIGit:
                 ]
                 opts = _adjust_opts(opts, prefer_cli, overriding_opts)
                 assert (
-                    git.git_opts_override(exec_path=Path("tmp"))
+                    git.git_opts_override(exec_path=TMP_DIR)
                     .git_opts_override(noglob_pathspecs=True, no_advice=True)
-                    .git_opts_override(config_env={"auth": "suhas", "comm": "suyog"})
+                    .git_opts_override(config_env=CONFIG_ENV)
                     .git_opts_override(no_pager=True)
                     .build_main_cmd_args()
                     == opts
@@ -856,7 +750,7 @@ class TestMainCLIGit:
                 only --exec-path is set in first ``git_opts_override()`` call and is unset in next ``git_opts_override()`` call.
                 """
                 git = CLISimpleGitCommand(opts=["--no-pager"])
-                assert git.git_opts_override(exec_path=Path("tmp")).git_opts_override(
+                assert git.git_opts_override(exec_path=TMP_DIR).git_opts_override(
                     exec_path=UNSET
                 ).build_main_cmd_args() == ["--no-pager"]
 
@@ -865,10 +759,10 @@ class TestMainCLIGit:
                 only --exec-path is set in first ``git_opts_override()`` call and is unset in next ``git_opts_override()`` call
                 but is set from before in the ctor.
                 """
-                opts = ["--exec-path", str(Path("tmp", "exec"))]
+                opts = ["--exec-path", TMP_EXEC_DIR_STR]
                 git = CLISimpleGitCommand(opts=opts.copy())
                 assert (
-                    git.git_opts_override(exec_path=Path("tmp"))
+                    git.git_opts_override(exec_path=TMP_DIR)
                     .git_opts_override(exec_path=UNSET)
                     .build_main_cmd_args()
                     == opts
@@ -881,9 +775,9 @@ class TestMainCLIGit:
                 """
                 opts = ["--no-pager"]
                 git = CLISimpleGitCommand(opts=["--no-pager"], prefer_cli=prefer_cli)
-                opts = _adjust_opts(opts, prefer_cli, ["-C", str(Path("."))])
+                opts = _adjust_opts(opts, prefer_cli, ["-C", CUR_DIR_STR])
                 assert (
-                    git.git_opts_override(exec_path=Path("tmp"), C=[Path()])
+                    git.git_opts_override(exec_path=TMP_DIR, C=[CUR_DIR])
                     .git_opts_override(exec_path=UNSET)
                     .build_main_cmd_args()
                     == opts
@@ -895,179 +789,23 @@ class TestMainCLIGit:
                 -C and --exec-path is set in first ``git_opts_override()`` call and is unset in next ``git_opts_override()`` call
                 but is set from before in the ctor.
                 """
-                opts = ["--exec-path", str(Path("tmp", "exec"))]
+                opts = ["--exec-path", TMP_EXEC_DIR_STR]
                 git = CLISimpleGitCommand(opts=opts.copy(), prefer_cli=prefer_cli)
-                opts = _adjust_opts(opts, prefer_cli, ["-C", str(Path("."))])
+                opts = _adjust_opts(opts, prefer_cli, ["-C", CUR_DIR_STR])
                 assert (
-                    git.git_opts_override(exec_path=Path("tmp"), C=[Path()])
+                    git.git_opts_override(exec_path=TMP_DIR, C=[CUR_DIR])
                     .git_opts_override(exec_path=UNSET)
                     .build_main_cmd_args()
                     == opts
                 )
 
-            class TestMultipleCalls:
-                def test_unset_value_on_last_call(self):
-                    """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in last ``git_opts_override()`` call.
-                    """
-                    git = SimpleGitCommand()
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(exec_path=UNSET).build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                    ]
-
-                def test_unset_value_on_non_last_call(self):
-                    """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in next ``git_opts_override()`` call.
-                    * --no-replace-objects is set in last ``git_opts_override()`` call.
-                    """
-                    git = SimpleGitCommand()
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(exec_path=UNSET).git_opts_override(
-                        no_replace_objects=True
-                    ).build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                        "--no-replace-objects",
-                    ]
-
-                def test_no_value_on_non_last_call(self):
-                    """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in next ``git_opts_override()`` call.
-                    * no value given to last ``git_opts_override()`` call.
-                    """
-                    git = SimpleGitCommand()
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(
-                        exec_path=UNSET
-                    ).git_opts_override().build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                    ]
-
-                def test_re_set_value_on_non_last_call(self):
-                    """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in next ``git_opts_override()`` call.
-                    * --no-replace-objects is set in last ``git_opts_override()`` call.
-                    """
-                    git = SimpleGitCommand()
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(exec_path=UNSET).git_opts_override(
-                        exec_path=Path()
-                    ).build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                        "--exec-path",
-                        ".",
-                    ]
-
-        class TestIndividualMethods:
-            class TestSmallC:
-                @pytest.mark.parametrize(
-                    "input_dict,expected",
-                    [
-                        # Simple key-value
-                        ({"foo.bar": "baz"}, ["-c", "foo.bar=baz"]),
-                        # Empty string value
-                        ({"foo.bar": ""}, ["-c", "foo.bar="]),
-                        # Boolean True (no equals sign)
-                        ({"foo.bar": True}, ["-c", "foo.bar"]),
-                        # Boolean False (explicit empty string)
-                        ({"foo.bar": False}, ["-c", "foo.bar="]),
-                        # None (treated as True)
-                        ({"foo.bar": None}, ["-c", "foo.bar"]),
-                        # Mixed values
-                        (
-                            {
-                                "a.b": "x",
-                                "c.d": "",
-                                "e.f": True,
-                                "g.h": False,
-                                "i.j": None,
-                            },
-                            [
-                                "-c",
-                                "a.b=x",
-                                "-c",
-                                "c.d=",
-                                "-c",
-                                "e.f",
-                                "-c",
-                                "g.h=",
-                                "-c",
-                                "i.j",
-                            ],
-                        ),
-                        # Empty config (no args)
-                        ({}, []),
-                        # c is None
-                        (None, []),
-                        # c is UNSET
-                        (UNSET, []),
-                        # Missing key
-                        ({}, []),
-                        # UNSET should remove the key
-                        (
-                            {"foo.bar": "value", "bar.baz": UNSET},
-                            ["-c", "foo.bar=value"],
-                        ),
-                        # All keys are unset
-                        ({"foo.bar": UNSET}, []),
-                        # Mixed unset, true, false
-                        (
-                            {"a.b": UNSET, "b.c": True, "c.d": False},
-                            ["-c", "b.c", "-c", "c.d="],
-                        ),
-                    ],
-                )
-                def test_main_cmd_c_args(self, input_dict, expected):
-                    git = SimpleGitCommand().git_opts_override(c=input_dict)
-                    assert git._main_cmd_small_c_args() == expected
-
     class TestEnvOverrides:
         class TestSupplied:
             class TestSameCall:
                 @pytest.mark.parametrize("prefer_cli", [True, False])
                 def test_one_supplied(self, prefer_cli):
                     git = CLISimpleGitCommand(
-                        envs=dict(GIT_AUTHOR_NAME="ss"), prefer_cli=prefer_cli
+                        envs={"GIT_AUTHOR_NAME": "ss"}, prefer_cli=prefer_cli
                     )
                     assert git.git_envs_override(GIT_TRACE=True).build_git_envs() == {
                         "GIT_AUTHOR_NAME": "ss",
@@ -1077,45 +815,17 @@ class TestMainCLIGit:
                 def test_multiple_supplied(self):
                     git = SimpleGitCommand()
                     assert git.git_envs_override(
-                        GIT_TRACE=1, GIT_DIR=Path("/tmp/git-dir/"), GIT_EDITOR="vim"
+                        GIT_TRACE=1, GIT_DIR=GIT_DIR_PATH, GIT_EDITOR="vim"
                     ).build_git_envs() == {
                         "GIT_TRACE": "1",
-                        "GIT_DIR": str(Path("/tmp/git-dir")),
+                        "GIT_DIR": GIT_DIR_PATH_STR,
                         "GIT_EDITOR": "vim",
                     }
 
                 class TestMainOptMixed:
-                    def test_one_supplied_main_opts_last_call(self):
-                        git = SimpleGitCommand()
-                        assert git.git_envs_override(GIT_TRACE=True).git_opts_override(
-                            no_pager=True
-                        ).build_git_envs() == {"GIT_TRACE": "True"}
-
-                    def test_one_supplied_main_opts_non_last_call(self):
-                        git = SimpleGitCommand()
-                        assert git.git_opts_override(no_pager=True).git_envs_override(
-                            GIT_TRACE=True
-                        ).build_git_envs() == {"GIT_TRACE": "True"}
-
-                    def test_multiple_supplied_main_opts_first(self):
-                        git = SimpleGitCommand()
-                        assert git.git_opts_override(no_advice=True).git_envs_override(
-                            GIT_TRACE=1, GIT_DIR=Path("/tmp/git-dir/"), GIT_EDITOR="vim"
-                        ).build_git_envs() == {
-                            "GIT_TRACE": "1",
-                            "GIT_DIR": str(Path("/tmp/git-dir")),
-                            "GIT_EDITOR": "vim",
-                        }
-
-                    def test_multiple_supplied_main_opts_last(self):
-                        git = SimpleGitCommand()
-                        assert git.git_envs_override(
-                            GIT_TRACE=1, GIT_DIR=Path("/tmp/git-dir/"), GIT_EDITOR="vim"
-                        ).git_opts_override(no_advice=True).build_git_envs() == {
-                            "GIT_TRACE": "1",
-                            "GIT_DIR": str(Path("/tmp/git-dir")),
-                            "GIT_EDITOR": "vim",
-                        }
+                    @pytest.mark.parametrize("build, expected", MAIN_OPT_MIXED_CASES)
+                    def test_main_opts_order(self, build, expected):
+                        assert build(SimpleGitCommand()).build_git_envs() == expected
 
         class TestMultipleCalls:
             def test_one_supplied(self):
@@ -1135,17 +845,15 @@ class TestMainCLIGit:
 
             def test_multiple_supplied(self):
                 git = SimpleGitCommand()
-                assert git.git_envs_override(
-                    GIT_SSH=Path("/tmp/SSH")
-                ).git_envs_override(
+                assert git.git_envs_override(GIT_SSH=SSH_PATH).git_envs_override(
                     GIT_TERMINAL_PROMPT=1, GIT_NO_REPLACE_OBJECTS=True
                 ).git_envs_override(
-                    GIT_ALTERNATE_OBJECT_DIRECTORIES=Path("/tmp/alter")
+                    GIT_ALTERNATE_OBJECT_DIRECTORIES=ALTER_DIR
                 ).build_git_envs() == {
-                    "GIT_SSH": str(Path("/tmp/SSH")),
+                    "GIT_SSH": SSH_PATH_STR,
                     "GIT_TERMINAL_PROMPT": "1",
                     "GIT_NO_REPLACE_OBJECTS": "True",
-                    "GIT_ALTERNATE_OBJECT_DIRECTORIES": str(Path("/tmp/alter")),
+                    "GIT_ALTERNATE_OBJECT_DIRECTORIES": ALTER_DIR_STR,
                 }
 
             class TestMainOptsMixed:
@@ -1164,7 +872,7 @@ class TestMainCLIGit:
                 def test_one_supplied_more_calls(self):
                     git = SimpleGitCommand()
                     assert git.git_envs_override().git_opts_override(
-                        exec_path=Path("/tmp/git-dir")
+                        exec_path=GIT_DIR_PATH
                     ).git_envs_override(GIT_TRACE_SETUP=2).git_envs_override(
                         GIT_ADVICE=False
                     ).git_opts_override(
@@ -1176,19 +884,17 @@ class TestMainCLIGit:
 
                 def test_multiple_supplied(self):
                     git = SimpleGitCommand()
-                    assert git.git_envs_override(
-                        GIT_SSH=Path("/tmp/SSH")
-                    ).git_opts_override(
-                        exec_path=Path("/tmp/git-dir")
+                    assert git.git_envs_override(GIT_SSH=SSH_PATH).git_opts_override(
+                        exec_path=GIT_DIR_PATH
                     ).git_envs_override(
                         GIT_TERMINAL_PROMPT=1, GIT_NO_REPLACE_OBJECTS=True
                     ).git_envs_override(
-                        GIT_ALTERNATE_OBJECT_DIRECTORIES=Path("/tmp/alter")
+                        GIT_ALTERNATE_OBJECT_DIRECTORIES=ALTER_DIR
                     ).build_git_envs() == {
-                        "GIT_SSH": str(Path("/tmp/SSH")),
+                        "GIT_SSH": SSH_PATH_STR,
                         "GIT_TERMINAL_PROMPT": "1",
                         "GIT_NO_REPLACE_OBJECTS": "True",
-                        "GIT_ALTERNATE_OBJECT_DIRECTORIES": str(Path("/tmp/alter")),
+                        "GIT_ALTERNATE_OBJECT_DIRECTORIES": ALTER_DIR_STR,
                     }
 
         class TestOverrideValues:
@@ -1198,7 +904,7 @@ class TestMainCLIGit:
                 """
                 git = SimpleGitCommand()
                 assert (
-                    git.git_envs_override(GIT_DIR=Path("tmp"))
+                    git.git_envs_override(GIT_DIR=TMP_DIR)
                     .git_envs_override(GIT_DIR=UNSET)
                     .build_git_envs()
                     == {}
@@ -1210,168 +916,12 @@ class TestMainCLIGit:
                 """
                 git = SimpleGitCommand()
                 assert git.git_envs_override(
-                    GIT_DIR=Path("tmp"), GIT_TRACE=2, GIT_ADVICE=0
+                    GIT_DIR=TMP_DIR, GIT_TRACE=2, GIT_ADVICE=0
                 ).git_envs_override(GIT_DIR=UNSET).build_git_envs() == {
                     "GIT_TRACE": "2",
                     "GIT_ADVICE": "0",
                 }
 
-            class TestMultipleCalls:
-                def test_unset_value_on_last_call(self):
-                    """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in last ``git_opts_override()`` call.
-                    """
-                    git = SimpleGitCommand()
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(exec_path=UNSET).build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                    ]
-
-                def test_unset_value_on_non_last_call(self):
-                    """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in next ``git_opts_override()`` call.
-                    * --no-replace-objects is set in last ``git_opts_override()`` call.
-                    """
-                    git = SimpleGitCommand()
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(exec_path=UNSET).git_opts_override(
-                        no_replace_objects=True
-                    ).build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                        "--no-replace-objects",
-                    ]
-
-                def test_no_value_on_non_last_call(self):
-                    """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in next ``git_opts_override()`` call.
-                    * no value given to last ``git_opts_override()`` call.
-                    """
-                    git = SimpleGitCommand()
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(
-                        exec_path=UNSET
-                    ).git_opts_override().build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                    ]
-
-                def test_re_set_value_on_non_last_call(self):
-                    """
-                    * -C and --exec-path is set in first ``git_opts_override()`` call.
-                    * --config-env is set in the next ``git_opts_override()`` call.
-                    * --exec-path is unset in next ``git_opts_override()`` call.
-                    * --no-replace-objects is set in last ``git_opts_override()`` call.
-                    """
-                    git = SimpleGitCommand()
-                    assert git.git_opts_override(
-                        exec_path=Path("tmp"), C=[Path()]
-                    ).git_opts_override(
-                        config_env={"auth": "suhas", "comm": "suyog"}
-                    ).git_opts_override(exec_path=UNSET).git_opts_override(
-                        exec_path=Path()
-                    ).build_main_cmd_args() == [
-                        "-C",
-                        ".",
-                        "--config-env",
-                        "auth=suhas",
-                        "--config-env",
-                        "comm=suyog",
-                        "--exec-path",
-                        ".",
-                    ]
-
-        class TestIndividualMethods:
-            class TestSmallC:
-                @pytest.mark.parametrize(
-                    "input_dict,expected",
-                    [
-                        # Simple key-value
-                        ({"foo.bar": "baz"}, ["-c", "foo.bar=baz"]),
-                        # Empty string value
-                        ({"foo.bar": ""}, ["-c", "foo.bar="]),
-                        # Boolean True (no equals sign)
-                        ({"foo.bar": True}, ["-c", "foo.bar"]),
-                        # Boolean False (explicit empty string)
-                        ({"foo.bar": False}, ["-c", "foo.bar="]),
-                        # None (treated as True)
-                        ({"foo.bar": None}, ["-c", "foo.bar"]),
-                        # Mixed values
-                        (
-                            {
-                                "a.b": "x",
-                                "c.d": "",
-                                "e.f": True,
-                                "g.h": False,
-                                "i.j": None,
-                            },
-                            [
-                                "-c",
-                                "a.b=x",
-                                "-c",
-                                "c.d=",
-                                "-c",
-                                "e.f",
-                                "-c",
-                                "g.h=",
-                                "-c",
-                                "i.j",
-                            ],
-                        ),
-                        # Empty config (no args)
-                        ({}, []),
-                        # c is None
-                        (None, []),
-                        # c is UNSET
-                        (UNSET, []),
-                        # Missing key
-                        ({}, []),
-                        # UNSET should remove the key
-                        (
-                            {"foo.bar": "value", "bar.baz": UNSET},
-                            ["-c", "foo.bar=value"],
-                        ),
-                        # All keys are unset
-                        ({"foo.bar": UNSET}, []),
-                        # Mixed unset, true, false
-                        (
-                            {"a.b": UNSET, "b.c": True, "c.d": False},
-                            ["-c", "b.c", "-c", "c.d="],
-                        ),
-                    ],
-                )
-                def test_main_cmd_c_args(self, input_dict, expected):
-                    git = SimpleGitCommand().git_opts_override(c=input_dict)
-                    assert git._main_cmd_small_c_args() == expected
-
     class TestOptsEnvMixedOverrides:
         class TestNoOverrides:
             def test_leaves_envs_empty(self):
@@ -1392,20 +942,20 @@ class TestMainCLIGit:
                 def test_once(self):
                     git = SimpleGitCommand()
                     envs_o_git = git.git_envs_override(
-                        GIT_AUTHOR_NAME="ss", GIT_OBJECT_DIRECTORY=Path("/tmp/obj-dir/")
+                        GIT_AUTHOR_NAME="ss", GIT_OBJECT_DIRECTORY=OBJ_DIR
                     )
                     assert (
                         git._env_vars is None
                     )  # parent ``git`` object protected properties still empty.
                     assert envs_o_git._env_vars == {
                         "GIT_AUTHOR_NAME": "ss",
-                        "GIT_OBJECT_DIRECTORY": Path("/tmp/obj-dir/"),
+                        "GIT_OBJECT_DIRECTORY": OBJ_DIR,
                     }
 
                 def test_twice(self):
                     git = SimpleGitCommand()
                     envs_o_git = git.git_envs_override(
-                        GIT_AUTHOR_NAME="ss", GIT_OBJECT_DIRECTORY=Path("/tmp/obj-dir/")
+                        GIT_AUTHOR_NAME="ss", GIT_OBJECT_DIRECTORY=OBJ_DIR
                     )
                     envs_o_o_git = envs_o_git.git_envs_override(GIT_SSH_COMMAND="gpg")
                     assert (
@@ -1413,11 +963,11 @@ class TestMainCLIGit:
                     )  # ancestor ``git`` object protected properties still empty.
                     assert envs_o_git._env_vars == {
                         "GIT_AUTHOR_NAME": "ss",
-                        "GIT_OBJECT_DIRECTORY": Path("/tmp/obj-dir/"),
+                        "GIT_OBJECT_DIRECTORY": OBJ_DIR,
                     }  # parent git protected properties still not overridden
                     assert envs_o_o_git._env_vars == {
                         "GIT_AUTHOR_NAME": "ss",
-                        "GIT_OBJECT_DIRECTORY": Path("/tmp/obj-dir/"),
+                        "GIT_OBJECT_DIRECTORY": OBJ_DIR,
                         "GIT_SSH_COMMAND": "gpg",
                     }  # new property added in child object
 
@@ -1425,20 +975,20 @@ class TestMainCLIGit:
                 def test_once(self):
                     git = SimpleGitCommand()
                     main_o_git = git.git_opts_override(
-                        namespace="ss", git_dir=Path("/tmp/git-dir/.git")
+                        namespace="ss", git_dir=DOT_GIT_DIR
                     )
                     assert (
                         git._main_cmd_opts == {}
                     )  # parent ``git`` object protected properties still empty.
                     assert main_o_git._main_cmd_opts == {
                         "namespace": "ss",
-                        "git_dir": Path("/tmp/git-dir/.git"),
+                        "git_dir": DOT_GIT_DIR,
                     }
 
                 def test_twice(self):
                     git = SimpleGitCommand()
                     main_o_git = git.git_opts_override(
-                        namespace="ss", git_dir=Path("/tmp/git-dir/.git")
+                        namespace="ss", git_dir=DOT_GIT_DIR
                     )
                     main_o_o_git = main_o_git.git_opts_override(paginate=True)
                     assert (
@@ -1446,11 +996,11 @@ class TestMainCLIGit:
                     )  # ancestor ``git`` object protected properties still empty.
                     assert main_o_git._main_cmd_opts == {
                         "namespace": "ss",
-                        "git_dir": Path("/tmp/git-dir/.git"),
+                        "git_dir": DOT_GIT_DIR,
                     }  # parent git protected properties still not overridden
                     assert main_o_o_git._main_cmd_opts == {
                         "namespace": "ss",
-                        "git_dir": Path("/tmp/git-dir/.git"),
+                        "git_dir": DOT_GIT_DIR,
                         "paginate": True,
                     }  # new property added in child object
 
@@ -1458,7 +1008,7 @@ class TestMainCLIGit:
             def test_override_envs(self):
                 git = SimpleGitCommand()
                 envs_o_git = git.git_envs_override(
-                    GIT_AUTHOR_NAME="ss", GIT_OBJECT_DIRECTORY=Path("/tmp/obj-dir/")
+                    GIT_AUTHOR_NAME="ss", GIT_OBJECT_DIRECTORY=OBJ_DIR
                 )
                 assert (
                     git._main_cmd_opts == {}
@@ -1469,9 +1019,7 @@ class TestMainCLIGit:
 
             def test_override_opts(self):
                 git = SimpleGitCommand()
-                main_o_git = git.git_opts_override(
-                    namespace="ss", git_dir=Path("/tmp/git-dir/.git")
-                )
+                main_o_git = git.git_opts_override(namespace="ss", git_dir=DOT_GIT_DIR)
                 assert (
                     git._env_vars is None
                 )  # overriding opts didn't override envs in parent
@@ -1486,11 +1034,9 @@ class TestLsTreeSubcmd:
         git = SimpleGitCommand(repo_local)
         Path(repo_local, "a-file").write_text("a-file")
         git.add_subcmd.add(".")
-        git.subcmd_unchecked.run(["config", "--local", "user.name", "suhas"])
-        git.subcmd_unchecked.run(
-            ["config", "--local", "user.email", "suhas@example.com"]
+        git.git_opts_override(c=COMMITTER_CONFIG).subcmd_unchecked.run(
+            ["commit", "-m", "committed a-file"]
         )
-        git.subcmd_unchecked.run(["commit", "-m", "committed a-file"])
         assert (
             git.ls_tree_subcmd.ls_tree("HEAD")
             == "100644 blob 7c35e066a9001b24677ae572214d292cebc55979	a-file"
@@ -1515,20 +1061,87 @@ class TestLsTreeSubcmd:
                 '"%(objecttype) %(objectmode) %(objectname) %(objectsize)%x09%(path)"',
                 '"blob 100644 7c35e066a9001b24677ae572214d292cebc55979 6	a-file"',
             ),
+            ("  %(path)", "  a-file"),
         ],
     )
     def test_ls_tree_custom_fmt(self, repo_local, fmt, res):
         git = SimpleGitCommand(repo_local)
         Path(repo_local, "a-file").write_text("a-file")
         git.add_subcmd.add(".")
-        git.subcmd_unchecked.run(["config", "--local", "user.name", "suhas"])
-        git.subcmd_unchecked.run(
-            ["config", "--local", "user.email", "suhas@example.com"]
+        git.git_opts_override(c=COMMITTER_CONFIG).subcmd_unchecked.run(
+            ["commit", "-m", "committed a-file"]
         )
-        git.subcmd_unchecked.run(["commit", "-m", "committed a-file"])
         assert git.ls_tree_subcmd.ls_tree("HEAD", format_=fmt) == res
 
+    class TestLsTreeIter:
+        @staticmethod
+        def _commit_files(repo_local, *file_names):
+            git = SimpleGitCommand(repo_local)
+            for file_name in file_names:
+                Path(repo_local, file_name).write_text(file_name)
+            git.add_subcmd.add(".")
+            git.git_opts_override(c=COMMITTER_CONFIG).subcmd_unchecked.run(
+                ["commit", "-m", "committed files"]
+            )
+            return git
+
+        def test_matches_ls_tree(self, repo_local):
+            git = self._commit_files(repo_local, "a-file", "b-file")
+            assert list(git.ls_tree_subcmd.ls_tree_iter("HEAD", name_only=True)) == [
+                "a-file",
+                "b-file",
+            ]
+            assert list(git.ls_tree_subcmd.ls_tree_iter("HEAD")) == (
+                git.ls_tree_subcmd.ls_tree("HEAD").splitlines()
+            )
+
+        def test_nul_separated(self, repo_local):
+            git = self._commit_files(repo_local, "a-file", "b\nfile")
+            assert list(
+                git.ls_tree_subcmd.ls_tree_iter("HEAD", name_only=True, z=True)
+            ) == ["a-file", "b\nfile"]
+
+        def test_validates_eagerly(self):
+            with pytest.raises(GitExitingException) as e:
+                SimpleGitCommand().ls_tree_subcmd.ls_tree_iter("HEAD", abbrev=41)
+            assert e.value.exit_code == ERR_INVALID_USAGE
+
+        def test_fails_on_unknown_tree_ish(self, repo_local):
+            entries = SimpleGitCommand(repo_local).ls_tree_subcmd.ls_tree_iter("HEAD")
+            with pytest.raises(GitCmdException, match="Not a valid object name"):
+                list(entries)
+
+        def test_starts_git_on_first_entry(self, repo_local):
+            self._commit_files(repo_local, "a-file")
+            runner = _CountingPopenGitCR()
+            entries = SimpleGitCommand(
+                repo_local, runner=runner
+            ).ls_tree_subcmd.ls_tree_iter("HEAD", name_only=True)
+            assert runner.popen_calls == 0
+            assert next(entries) == "a-file"
+            assert runner.popen_calls == 1
+
+        def test_large_stderr_does_not_block(self, repo_local):
+            git = SimpleGitCommand(repo_local, runner=_NoisyStderrGitCR())
+            assert list(git.ls_tree_subcmd.ls_tree_iter("HEAD")) == ["an-entry"]
+
+        def test_runner_without_popen(self, repo_local):
+            git = self._commit_files(repo_local, "a-file", "b-file")
+            git = SimpleGitCommand(repo_local, runner=_RunOnlyGitCR())
+            assert list(git.ls_tree_subcmd.ls_tree_iter("HEAD", name_only=True)) == [
+                "a-file",
+                "b-file",
+            ]
+
     class TestArgValidation:
+        @pytest.fixture(scope="class")
+        @staticmethod
+        def ls_tree_subcmd():
+            """
+            One ``ls-tree`` subcommand for the whole class, the args are rejected before anything is run or stored.
+            """
+            return SimpleGitCommand().ls_tree_subcmd
+
         @pytest.mark.parametrize(
             "tree_ish",
             [
@@ -1546,30 +1159,30 @@ class TestLsTreeSubcmd:
                 object(),
             ],
         )
-        def test_tree_ish_must_be_str(self, tree_ish):
+        def test_tree_ish_must_be_str(self, ls_tree_subcmd, tree_ish):
             with pytest.raises(GitExitingException) as e:
-                SimpleGitCommand().ls_tree_subcmd.ls_tree(tree_ish)  # type: ignore[arg-type] # expects str and provided Any
+                ls_tree_subcmd.ls_tree(tree_ish)  # type: ignore[arg-type] # expects str and provided Any
             assert e.value.exit_code == ERR_DATA_FORMAT_ERR
 
         @pytest.mark.parametrize("abbrev", ["abc", True, 5.5, [5], None])
-        def test_abbrev_must_be_int(self, abbrev):
+        def test_abbrev_must_be_int(self, ls_tree_subcmd, abbrev):
             with pytest.raises(GitExitingException) as e:
-                SimpleGitCommand().ls_tree_subcmd.ls_tree("HEAD", abbrev=abbrev)  # type: ignore[arg-type] # expects int, provided Any
+                ls_tree_subcmd.ls_tree("HEAD", abbrev=abbrev)  # type: ignore[arg-type] # expects int, provided Any
             assert e.value.exit_code == ERR_DATA_FORMAT_ERR
 
         @pytest.mark.parametrize("abbrev", [-1, 41, 100])
-        def test_abbrev_must_be_in_range(self, abbrev):
+        def test_abbrev_must_be_in_range(self, ls_tree_subcmd, abbrev):
             with pytest.raises(GitExitingException) as e:
-                SimpleGitCommand().ls_tree_subcmd.ls_tree("HEAD", abbrev=abbrev)
+                ls_tree_subcmd.ls_tree("HEAD", abbrev=abbrev)
             assert e.value.exit_code == ERR_INVALID_USAGE
 
         @pytest.mark.parametrize(
             "format_",
             [10, True, None, ["format"], {"format": "value"}, 5.5, b"%(objectname)"],
         )
-        def test_format_must_be_str(self, format_):
+        def test_format_must_be_str(self, ls_tree_subcmd, format_):
             with pytest.raises(GitExitingException) as e:
-                SimpleGitCommand().ls_tree_subcmd.ls_tree("HEAD", format_=format_)  # type: ignore[arg-type] # expects str, provided Any
+                ls_tree_subcmd.ls_tree("HEAD", format_=format_)  # type: ignore[arg-type] # expects str, provided Any
             assert e.value.exit_code == ERR_DATA_FORMAT_ERR
 
         @pytest.mark.parametrize(
@@ -1585,9 +1198,9 @@ class TestLsTreeSubcmd:
                 {"a", "b"},
             ],
         )
-        def test_path_must_be_list_of_strings(self, path):
+        def test_path_must_be_list_of_strings(self, ls_tree_subcmd, path):
             with pytest.raises(GitExitingException) as e:
-                SimpleGitCommand().ls_tree_subcmd.ls_tree("HEAD", path=path)  # type: ignore[arg-type] # expects list[str], provided Any
+                ls_tree_subcmd.ls_tree("HEAD", path=path)  # type: ignore[arg-type] # expects list[str], provided Any
             assert e.value.exit_code == ERR_DATA_FORMAT_ERR
 
 
@@ -1680,15 +1293,12 @@ class TestSubcommandsPersistence:
         )
         git = git.git_envs_override(GIT_SSH_COMMAND="ssh-l")
         _subcmd = getattr(git, subcmd)
-        assert (
-            dict(
-                GIT_TRACE="True",
-                GIT_AUTHOR_NAME="ss",
-                GIT_COMMITTER_NAME="sos",
-                GIT_SSH_COMMAND="ssh-l",
-            )
-            == _subcmd.underlying_git.build_git_envs()
-        )
+        assert {
+            "GIT_TRACE": "True",
+            "GIT_AUTHOR_NAME": "ss",
+            "GIT_COMMITTER_NAME": "sos",
+            "GIT_SSH_COMMAND": "ssh-l",
+        } == _subcmd.underlying_git.build_git_envs()
 
     def test_opts_set_remain_set(self, repo_local, subcmd):
         git = SimpleGitCommand(repo_local)
@@ -1723,21 +1333,12 @@ class TestSubcommandsPersistence:
             "no_pager": True,
         } == _subcmd.underlying_git._main_cmd_opts
 
-        assert (
-            dict(
-                GIT_TRACE="True",
-                GIT_AUTHOR_NAME="ss",
-                GIT_COMMITTER_NAME="sos",
-                GIT_SSH_COMMAND="ssh-l",
-            )
-            == _subcmd.underlying_git.build_git_envs()
-        )
         assert {
-            "c": {"foo": True, "foo.bar": 10},
-            "git_dir": repo_local,
-            "icase_pathspecs": True,
-            "no_pager": True,
-        } == _subcmd.underlying_git._main_cmd_opts
+            "GIT_TRACE": "True",
+            "GIT_AUTHOR_NAME": "ss",
+            "GIT_COMMITTER_NAME": "sos",
+            "GIT_SSH_COMMAND": "ssh-l",
+        } == _subcmd.underlying_git.build_git_envs()
 
 
 # TODO: write exhaustive tests for unchecked subcmd
@@ -1814,3 +1415,211 @@ class TestUncheckedSubcmd:
             assert (
                 git.subcmd_unchecked.run(["log"], capture_output=False).stdout is None
             )
+
+
+class TestSubcommandsKeepCollaborators:
+    def test_ls_tree_builder_and_validator_retained(self, repo_local):
+        git = SimpleGitCommand(repo_local)
+        builder = IndividuallyOverridableLTCAB()
+        ls_tree_subcmd = LsTreeCommandImpl(repo_local, git, cli_args_builder=builder)
+        git = SimpleGitCommand(repo_local, ls_tree_subcmd=ls_tree_subcmd)
+        assert git.ls_tree_subcmd.cli_args_builder is builder
+        assert (
+            git.git_opts_override(no_pager=True).ls_tree_subcmd.cli_args_builder
+            is builder
+        )
+        assert git.ls_tree_subcmd.args_validator is ls_tree_subcmd.args_validator
+
+    def test_add_builder_and_validator_retained(self, repo_local):
+        git = SimpleGitCommand(repo_local)
+        builder = IndividuallyOverridableACAB()
+        add_subcmd = AddCommandImpl(repo_local, git, cli_args_builder=builder)
+        git = SimpleGitCommand(repo_local, add_subcmd=add_subcmd)
+        assert git.add_subcmd.cli_args_builder is builder
+        assert git.git_envs_override(GIT_TRACE=True).add_subcmd.cli_args_builder is (
+            builder
+        )
+        assert git.add_subcmd.args_validator is add_subcmd.args_validator
+
+
+class TestAsyncSubcmds:
+    def test_aversion(self):
+        git = SimpleGitCommand()
+        version_info = asyncio.run(git.version_subcmd.aversion())
+        assert version_info.version() == git.version().version()
+
+    def test_aversion_build_options(self):
+        git = SimpleGitCommand()
+        version_build_info = asyncio.run(
+            git.version_subcmd.aversion(build_options=True)
+        )
+        assert "git version 2" in version_build_info.version()
+        assert "cpu" in version_build_info.build_options()
+
+    def test_aversion_default(self):
+        git = SimpleGitCommand()
+        version_subcmd = _SyncOnlyVersionCommand(git)
+        version_info = asyncio.run(version_subcmd.aversion())
+        assert version_info.version() == git.version().version()
+
+    def test_aadd_and_als_tree(self, repo_local):
+        git = SimpleGitCommand(repo_local)
+        Path(repo_local, "a-file").write_text("a-file")
+        asyncio.run(git.add_subcmd.aadd("a-file"))
+        git.git_opts_override(c=COMMITTER_CONFIG).subcmd_unchecked.run(
+            ["commit", "-m", "committed a-file"]
+        )
+        assert asyncio.run(git.ls_tree_subcmd.als_tree("HEAD")) == (
+            git.ls_tree_subcmd.ls_tree("HEAD")
+        )
+
+    def test_als_tree_validates_args(self):
+        with pytest.raises(GitExitingException) as e:
+            asyncio.run(SimpleGitCommand().ls_tree_subcmd.als_tree("HEAD", abbrev=41))
+        assert e.value.exit_code == ERR_INVALID_USAGE
+
+    def test_als_tree_fails_on_unknown_tree_ish(self, repo_local):
+        git = SimpleGitCommand(repo_local)
+        with pytest.raises(GitCmdException, match="Not a valid object name"):
+            asyncio.run(git.ls_tree_subcmd.als_tree("HEAD"))
+
+    def test_gather_git_keeps_order(self):
+        git = SimpleGitCommand()
+        version_infos = asyncio.run(
+            gather_git(
+                git.version_subcmd.aversion(),
+                git.version_subcmd.aversion(build_options=True),
+                max_concurrent=1,
+            )
+        )
+        assert version_infos[0].version() == version_infos[1].version()
+        assert "cpu" in version_infos[1].build_options()
+
+
+class _SyncOnlyVersionCommand(VersionCommand, GitSubcmdCommandImpl):
+    """
+    A version subcommand as written before ``aversion()`` existed, i.e. implementing only ``version()``.
+    """
+
+    def version(self, build_options=False):
+        return VersionCommandImpl(self.underlying_git).version(build_options)
+
+    def clone(self):
+        return _SyncOnlyVersionCommand(self.underlying_git)
+
+
+class _RunOnlyGitCR(GitCommandRunner):
+    """
+    A runner implementing only ``run_git_command()``, like the runners written before ``popen_git_command()``.
+    """
+
+    def run_git_command(self, *args, **kwargs):
+        return SimpleGitCR().run_git_command(*args, **kwargs)
+
+
+class _CountingPopenGitCR(SimpleGitCR):
+    def __init__(self):
+        self.popen_calls = 0
+
+    def popen_git_command(self, *args, **kwargs):
+        self.popen_calls += 1
+        return super().popen_git_command(*args, **kwargs)
+
+
+class _NoisyStderrGitCR(SimpleGitCR):
+    """
+    A runner whose streamed command writes far more to stderr than a pipe holds, before writing to stdout.
+    """
+
+    def popen_git_command(self, main_cmd_args, subcommand_args, **popen_kwargs):
+        script = "import sys; sys.stderr.write('x' * (1 << 20)); print('an-entry')"
+        return subprocess.Popen([sys.executable, "-c", script], **popen_kwargs)
+
+
+class _CountingGitCR(SimpleGitCR):
+    def __init__(self):
+        self.calls = 0
+
+    def run_git_command(self, *args, **kwargs):
+        self.calls += 1
+        return super().run_git_command(*args, **kwargs)
+
+
+class TestCachingRunner:
+    def test_version_runs_once(self):
+        counting_runner = _CountingGitCR()
+        git = SimpleGitCommand(runner=CachingGitCR(counting_runner))
+        assert git.version().version() == git.version().version()
+        assert counting_runner.calls == 1
+
+    def test_different_opts_not_reused(self):
+        counting_runner = _CountingGitCR()
+        git = SimpleGitCommand(runner=CachingGitCR(counting_runner))
+        git.version().version()
+        git.git_opts_override(no_pager=True).version().version()
+        git.version_subcmd.version(build_options=True).build_options()
+        assert counting_runner.calls == 3
+
+    def test_exec_path_runs_once(self):
+        counting_runner = _CountingGitCR()
+        git = SimpleGitCommand(runner=CachingGitCR(counting_runner))
+        assert git.exec_path() == git.exec_path()
+        assert counting_runner.calls == 1
+
+    def test_different_cwd_not_reused(self, tmp_path):
+        counting_runner = _CountingGitCR()
+        caching_runner = CachingGitCR(counting_runner)
+        for cwd in (tmp_path, tmp_path.parent, tmp_path):
+            caching_runner.run_git_command(
+                [], ["version"], text=True, capture_output=True, cwd=cwd
+            )
+        assert counting_runner.calls == 2
+
+    def test_different_inherited_env_not_reused(self, monkeypatch):
+        counting_runner = _CountingGitCR()
+        git = SimpleGitCommand(runner=CachingGitCR(counting_runner))
+        exec_path = git.exec_path()
+        monkeypatch.setenv("GIT_EXEC_PATH", str(Path("/tmp/other-exec-path")))
+        assert git.exec_path() == Path("/tmp/other-exec-path") != exec_path
+        assert counting_runner.calls == 2
+
+    def test_callers_get_own_result(self):
+        caching_runner = CachingGitCR(_CountingGitCR())
+        first = caching_runner.run_git_command(
+            [], ["version"], text=True, capture_output=True
+        )
+        first.stdout = "changed by a caller"
+        second = caching_runner.run_git_command(
+            [], ["version"], text=True, capture_output=True
+        )
+        assert second.stdout.startswith("git version")
+
+    def test_clear(self):
+        counting_runner = _CountingGitCR()
+        caching_runner = CachingGitCR(counting_runner)
+        git = SimpleGitCommand(runner=caching_runner)
+        git.version().version()
+        caching_runner.clear()
+        git.version().version()
+        assert counting_runner.calls == 2
+
+    def test_repo_bound_subcmds_always_run(self, repo_local):
+        counting_runner = _CountingGitCR()
+        git = SimpleGitCommand(repo_local, runner=CachingGitCR(counting_runner))
+        Path(repo_local, "a-file").write_text("a-file")
+        git.add_subcmd.add("a-file")
+        Path(repo_local, "b-file").write_text("b-file")
+        git.add_subcmd.add("b-file")
+        indexed_files = git.subcmd_unchecked.run(
+            ["diff", "--cached", "--name-only"], text=True
+        ).stdout
+        assert "b-file" in indexed_files
+        assert counting_runner.calls == 3
+
+
+def test_repo_local_origin_is_own_repo_remote(repo_local, repo_remote):
+    git = SimpleGitCommand(repo_local)
+    origin_url = git.subcmd_unchecked.run(
+        ["remote", "get-url", "origin"], text=True
+    ).stdout.strip()
+    assert Path(origin_url) == Path(repo_remote)